@@ -0,0 +1,17 @@
+"""
+Static resource helpers for Renderware Modding Suite
+Locates and caches the files shipped under application/resources
+"""
+
+import os
+from functools import lru_cache
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources")
+ICONS_DIR = os.path.join(RESOURCES_DIR, "icons")
+
+
+@lru_cache(maxsize=None)
+def load_text_resource(name):
+    """Read a text resource on first use and return the cached string afterwards"""
+    with open(os.path.join(RESOURCES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
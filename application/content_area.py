@@ -14,6 +14,8 @@ from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QPropertyAnimation, QEasingCurv
 from PyQt6.QtGui import QAction, QIcon
 from application.debug_system import get_debug_logger, LogCategory
 from application.tools import ToolRegistry
+from application.file_viewers import create_file_viewer, make_header
+from application.common.resources import load_text_resource
 
 
 class ContentArea(QWidget):
@@ -232,8 +234,6 @@ class ContentArea(QWidget):
         if not os.path.exists(file_path):
             self.show_error(f"File not found: {file_path}")
             return
-
-        file_name = os.path.basename(file_path)
         
         # Check if file is already open in a tab
         for i in range(self.tab_widget.count()):
@@ -243,34 +243,9 @@ class ContentArea(QWidget):
                 self.tab_widget.setCurrentIndex(i)
                 return
 
-        # Create a simple file viewer widget
-        content_widget = QWidget()
-        layout = QVBoxLayout(content_widget)
-        
-        # Add file info
-        file_info_label = QLabel(f"File: {file_path}")
-        file_info_label.setWordWrap(True)
-        layout.addWidget(file_info_label)
-        
-        # Add text editor for viewing file content
-        text_editor = QTextEdit()
-        try:
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            text_editor.setPlainText(content)
-        except Exception as e:
-            text_editor.setPlainText(f"Cannot display file content: {str(e)}\nBinary file or encoding not supported.")
-        text_editor.setReadOnly(True)
-        layout.addWidget(text_editor)
-        
-        # Use a generic file icon
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext in ['.dff', '.txd', '.col', '.ifp', '.ide', '.ipl']:
-            icon_text = "📄"  # Document icon for known formats
-        else:
-            icon_text = "📄"  # Generic file icon
-            
-        tab_title = f"{icon_text} {file_name}"
+        # Create a viewer for the file type
+        content_widget = create_file_viewer(file_path)
+        tab_title = f"{content_widget.icon} {content_widget.file_name}"
 
         # Add tab with tooltip and custom close button
         tab_index = self.tab_widget.addTab(content_widget, tab_title)
@@ -340,30 +315,18 @@ class ContentArea(QWidget):
         # Tool header
         tool_info = ToolRegistry.get_tool_info(tool_name)
         if tool_info:
-            header_text = f"{tool_info['icon']} {tool_info['name']}"
-            description = tool_info['description']
+            header_text = f"{tool_info.icon} {tool_info.name}"
+            description = tool_info.description
         else:
             header_text = f"🔧 {tool_name.replace('_', ' ').title()}"
             description = "Tool implementation not found"
         
-        header_label = QLabel(header_text)
-        header_label.setStyleSheet("font-weight: bold; font-size: 16px; padding: 10px;")
-        layout.addWidget(header_label)
+        layout.addWidget(make_header(header_text))
         
         # Tool content (placeholder)
         content = QTextEdit()
-        content.setPlainText(f"""Tool: {tool_name}
-Parameters: {params}
-Description: {description}
-
-This tool is not yet implemented.
-In a complete implementation, this would provide:
-- Tool-specific controls and options
-- Real-time preview
-- Progress indicators
-- Result display
-
-This tool will be implemented in a future update.""")
+        content.setPlainText(load_text_resource("tool_placeholder.txt").format(
+            tool_name=tool_name, params=params, description=description))
         content.setReadOnly(True)
         layout.addWidget(content)
         
@@ -383,9 +346,7 @@ This tool will be implemented in a future update.""")
         widget = QWidget()
         layout = QVBoxLayout()
         
-        error_label = QLabel("❌ Error")
-        error_label.setStyleSheet("font-weight: bold; font-size: 16px; color: #ff6b6b; padding: 10px;")
-        layout.addWidget(error_label)
+        layout.addWidget(make_header("❌ Error", severity="error"))
         
         message_label = QLabel(message)
         message_label.setWordWrap(True)
@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QGroupBox,
                             QFileDialog, QDialog, QDialogButtonBox, QMessageBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from .responsive_utils import get_responsive_manager
+from .file_viewers import get_file_icon
 
 
 class FileExplorer(QWidget):
@@ -24,7 +25,6 @@ class FileExplorer(QWidget):
     def setup_ui(self):
         """Setup the file explorer UI with responsive sizing"""
         rm = get_responsive_manager()
-        fonts = rm.get_font_config()
         spacing = rm.get_spacing_config()
         
         layout = QVBoxLayout()
@@ -33,7 +33,6 @@ class FileExplorer(QWidget):
         # Header with responsive font
         header_label = QLabel("📁 File Browser")
         header_label.setObjectName("titleLabel")
-        header_label.setStyleSheet(f"font-weight: bold; font-size: {fonts['header']['size']}px; padding: {spacing['small']}px;")
         layout.addWidget(header_label)
         
         
@@ -96,18 +95,7 @@ class FileExplorer(QWidget):
         from application.responsive_utils import get_responsive_manager
         rm = get_responsive_manager()
         file_name = os.path.basename(file_path)
-        file_ext = os.path.splitext(file_name)[1].upper()
-        
-        # Add icon based on file type
-        icon_map = {
-            '.DFF': '📦',
-            '.TXD': '🖼️',
-            '.COL': '💥',
-            '.IFP': '🏃',
-            '.IDE': '📋',
-            '.IPL': '📍'
-        }
-        icon = icon_map.get(file_ext, '📄')
+        icon = get_file_icon(file_path)
         
         item = QListWidgetItem(f"{icon} {file_name}")
         item.setData(Qt.ItemDataRole.UserRole, file_path)
@@ -0,0 +1,111 @@
+"""
+File Viewers for Renderware Modding Suite
+Read-only viewer tabs for files opened outside of a dedicated tool
+"""
+
+import os
+from functools import lru_cache
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+# Per-extension icon shared by the viewer tabs and the file browser;
+# anything else uses GENERIC_FILE_ICON.
+FILE_VIEWER_ICONS = {
+    '.dff': '📦',
+    '.txd': '🖼️',
+    '.col': '💥',
+    '.ifp': '🏃',
+    '.ide': '📋',
+    '.ipl': '📍',
+}
+GENERIC_FILE_ICON = '📄'
+
+
+@lru_cache(maxsize=1024)
+def _split(file_path):
+    """Return (file name, lower-case extension) for a path, memoized"""
+    return os.path.basename(file_path), os.path.splitext(file_path)[1].lower()
+
+
+def make_header(text, severity=None):
+    """Create a header label styled by the global QLabel#viewerHeader rule"""
+    header_label = QLabel(text)
+    header_label.setObjectName("viewerHeader")
+    if severity:
+        header_label.setProperty("severity", severity)
+    return header_label
+
+
+class FileReadSignals(QObject):
+    """Carries file contents read on a worker back to the GUI thread"""
+    finished = pyqtSignal(str)
+
+
+class FileReadTask(QRunnable):
+    """Reads a file's text on a thread pool worker"""
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = FileReadSignals()
+
+    def run(self):
+        try:
+            with open(self.file_path, 'r', encoding='utf-8', errors='replace') as f:
+                content = f.read()
+        except Exception as e:
+            content = f"Cannot display file content: {str(e)}\nBinary file or encoding not supported."
+        self.signals.finished.emit(content)
+
+
+class FileViewer(QWidget):
+    """Read-only file viewer with a per-extension tab icon"""
+
+    def __init__(self, file_path, file_name, icon, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.file_name = file_name
+        self.icon = icon
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the header and the file content view"""
+        layout = QVBoxLayout(self)
+
+        # Plain info label; the viewerHeader rule is only for tool and error pages
+        file_info_label = QLabel(f"File: {self.file_path}")
+        file_info_label.setWordWrap(True)
+        layout.addWidget(file_info_label)
+
+        self.text_editor = QTextEdit()
+        self.text_editor.setReadOnly(True)
+        layout.addWidget(self.text_editor)
+
+        # Contents are loaded on first show so background tabs cost nothing
+        self._initialized = False
+
+    def showEvent(self, event):
+        """Populate the viewer the first time its tab becomes visible"""
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            self._populate()
+
+    def _populate(self):
+        """Start reading the file on the thread pool and fill the view when ready"""
+        self.text_editor.setPlainText("Loading…")
+        task = FileReadTask(self.file_path)
+        task.signals.finished.connect(self.text_editor.setPlainText)
+        QThreadPool.globalInstance().start(task)
+
+
+def get_file_icon(file_path):
+    """Icon shown for a file in tabs and file lists"""
+    return FILE_VIEWER_ICONS.get(_split(file_path)[1], GENERIC_FILE_ICON)
+
+
+def create_file_viewer(file_path, parent=None):
+    """Create the viewer widget for a file based on its extension"""
+    file_name, ext = _split(file_path)
+    return FileViewer(file_path, file_name, FILE_VIEWER_ICONS.get(ext, GENERIC_FILE_ICON), parent)
@@ -6,10 +6,19 @@ Coordinates all components and manages application state
 import sys
 import os
 from pathlib import Path
+
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    # psutil is optional; memory monitoring is skipped without it
+    psutil = None
+    _HAS_PSUTIL = False
+
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QSplitter, QMenuBar, QMenu, QMessageBox)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QAction, QIcon, QFont, QPalette, QColor, QScreen
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction, QIcon, QFont, QPalette, QColor, QScreen, QShortcut, QKeySequence
 
 # Import modular components
 from application.styles import ModernDarkTheme
@@ -20,10 +29,55 @@ from application.status_bar import StatusBarWidget
 from application.responsive_utils import get_responsive_manager
 from application.debug_system import get_debug_logger, LogLevel, LogCategory, debug_function
 
+# Enum members used by the main window, resolved once at import
+_HORIZONTAL = Qt.Orientation.Horizontal
+_APP_SHORTCUT = Qt.ShortcutContext.ApplicationShortcut
+
+
+class MemProbeSignals(QObject):
+    """Carries memory probe results back to the GUI thread"""
+    finished = pyqtSignal(float)
+    failed = pyqtSignal(str)
+
+
+class MemProbe(QRunnable):
+    """Reads the process resident set size on a thread pool worker"""
+    
+    def __init__(self, process, signals):
+        super().__init__()
+        self._proc = process
+        self._signals = signals
+    
+    def run(self):
+        try:
+            rss = self._proc.memory_info().rss
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.finished.emit(rss / 1024 / 1024)
+
 
 class RenderwareModdingSuite(QMainWindow):
     """Main application window"""
     
+    _ABOUT_HTML = """<h3>Renderware Modding Suite</h3>
+    <p>Professional modding tools for GTA 3D era games</p>
+    <p><b>Supported Games:</b><br>
+    • Grand Theft Auto III<br>
+    • Grand Theft Auto: Vice City<br>
+    • Grand Theft Auto: San Andreas</p>
+    
+    <p><b>Supported Formats:</b><br>
+    • DFF (3D Models)<br>
+    • TXD (Textures)<br>
+    • COL (Collision)<br>
+    • IFP (Animations)<br>
+    • IDE (Definitions)<br>
+    • IPL (Placements)</p>
+    
+    <p><b>Version:</b> 1.0<br>
+    <b>Frontend:</b> PyQt6</p>"""
+    
     def __init__(self):
         super().__init__()
         
@@ -40,7 +94,11 @@ class RenderwareModdingSuite(QMainWindow):
         # End setup timer
         self.debug_logger.end_performance_timer(setup_timer)
         
-        # Memory monitoring timer
+        # Memory monitoring timer (the probe itself runs on the thread pool)
+        self._proc = None
+        self._memory_signals = MemProbeSignals(self)
+        self._memory_signals.finished.connect(self._on_memory_probed)
+        self._memory_signals.failed.connect(self._on_memory_probe_failed)
         self.memory_timer = QTimer()
         self.memory_timer.timeout.connect(self.update_memory_usage)
         self.memory_timer.start(5000)  # Update every 5 seconds
@@ -98,7 +156,7 @@ class RenderwareModdingSuite(QMainWindow):
         main_layout.setContentsMargins(margins[0], margins[1], margins[2], margins[3])
         
         # Create horizontal splitter for main content
-        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter = QSplitter(_HORIZONTAL)
         
         # Get panel widths
         panel_min, panel_max = rm.get_panel_width()
@@ -222,16 +280,24 @@ class RenderwareModdingSuite(QMainWindow):
         
         window_menu.addSeparator()
         
-        next_tab_action = QAction('&Next Tab', self)
-        next_tab_action.setShortcut('Ctrl+Tab')
+        # Tab cycling keys are bound with application-wide QShortcuts below;
+        # the menu entries only display the key hint
+        next_tab_action = QAction('&Next Tab\tCtrl+Tab', self)
         next_tab_action.triggered.connect(self.switch_to_next_tab)
         window_menu.addAction(next_tab_action)
         
-        prev_tab_action = QAction('&Previous Tab', self)
-        prev_tab_action.setShortcut('Ctrl+Shift+Tab')
+        prev_tab_action = QAction('&Previous Tab\tCtrl+Shift+Tab', self)
         prev_tab_action.triggered.connect(self.switch_to_previous_tab)
         window_menu.addAction(prev_tab_action)
         
+        self.next_tab_shortcut = QShortcut(QKeySequence('Ctrl+Tab'), self)
+        self.next_tab_shortcut.setContext(_APP_SHORTCUT)
+        self.next_tab_shortcut.activated.connect(self.switch_to_next_tab)
+        
+        self.prev_tab_shortcut = QShortcut(QKeySequence('Ctrl+Shift+Tab'), self)
+        self.prev_tab_shortcut.setContext(_APP_SHORTCUT)
+        self.prev_tab_shortcut.activated.connect(self.switch_to_previous_tab)
+        
         window_menu.addSeparator()
         
         # UI Scale options
@@ -270,29 +336,34 @@ class RenderwareModdingSuite(QMainWindow):
         """Load file in content area"""
         self.debug_logger.log_user_action("Load File", {"file_path": file_path})
         
-        load_timer = self.debug_logger.start_performance_timer(f"Load File: {os.path.basename(file_path)}")
+        name = os.path.basename(file_path)
+        load_timer = self.debug_logger.start_performance_timer("Load File: " + name)
         
-        self.status_bar.set_status(f"Loading {os.path.basename(file_path)}...")
+        self.status_bar.set_status("Loading " + name + "...")
         self.status_bar.set_file_info(file_path)
         
+        success = True
+        error_msg = ""
         try:
-            # Load file in content area
+            # Load file in content area (exactly once, even on failure)
             self.content_area.load_file(file_path)
-            self.status_bar.show_success(f"Loaded {os.path.basename(file_path)}")
             
             self.debug_logger.log_file_operation("load", file_path, True, {
                 "file_size": os.path.getsize(file_path) if os.path.exists(file_path) else 0
             })
                 
         except Exception as e:
+            success = False
+            error_msg = str(e)
             self.debug_logger.log_exception(LogCategory.FILE_IO, f"Failed to load file: {file_path}", e)
-            self.status_bar.show_error(f"Error loading file: {str(e)}")
-            
-            # Still try to show file in UI
-            self.content_area.load_file(file_path)
         
         finally:
             self.debug_logger.end_performance_timer(load_timer)
+        
+        if success:
+            self.status_bar.show_success("Loaded " + name)
+        else:
+            self.status_bar.show_error("Error loading file: " + error_msg)
     
     def handle_tool_request(self, tool_name, params):
         """Handle tool request from tools panel"""
@@ -300,12 +371,13 @@ class RenderwareModdingSuite(QMainWindow):
         
         tool_timer = self.debug_logger.start_performance_timer(f"Open Tool: {tool_name}")
         
-        self.status_bar.set_status(f"Opening {tool_name.replace('_', ' ').title()}...")
+        title = tool_name.replace('_', ' ').title()
+        self.status_bar.set_status("Opening " + title + "...")
         
         try:
             # Show tool interface
             self.content_area.show_tool_interface(tool_name, params)
-            self.status_bar.show_success(f"Opened {tool_name.replace('_', ' ').title()}")
+            self.status_bar.show_success("Opened " + title)
             
             self.debug_logger.log_tool_operation(tool_name, "opened", params)
         
@@ -336,48 +408,30 @@ class RenderwareModdingSuite(QMainWindow):
     
     def show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self,
-            "About Renderware Modding Suite",
-            """<h3>Renderware Modding Suite</h3>
-            <p>Professional modding tools for GTA 3D era games</p>
-            <p><b>Supported Games:</b><br>
-            • Grand Theft Auto III<br>
-            • Grand Theft Auto: Vice City<br>
-            • Grand Theft Auto: San Andreas</p>
-            
-            <p><b>Supported Formats:</b><br>
-            • DFF (3D Models)<br>
-            • TXD (Textures)<br>
-            • COL (Collision)<br>
-            • IFP (Animations)<br>
-            • IDE (Definitions)<br>
-            • IPL (Placements)</p>
-            
-            <p><b>Version:</b> 1.0<br>
-            <b>Frontend:</b> PyQt6</p>"""
-        )
+        QMessageBox.about(self, "About Renderware Modding Suite", self._ABOUT_HTML)
     
     def update_memory_usage(self):
-        """Update memory usage display"""
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            
-            # Log memory usage to debug system
-            self.debug_logger.log_memory_usage("Main Application", memory_mb)
-            
-            # Update status bar with memory usage - pass the float value directly
-            if hasattr(self, 'status_bar'):
-                self.status_bar.set_memory_usage(memory_mb)
-                
-        except ImportError:
-            # psutil not available, skip memory monitoring
-            pass
-        except Exception as e:
-            self.debug_logger.error(LogCategory.MEMORY, f"Error updating memory usage: {e}")
+        """Start a background memory probe; the result arrives via _on_memory_probed"""
+        if not _HAS_PSUTIL or not self.status_bar.isVisible():
+            # Nothing to probe or nothing would render the reading; the timer simply re-arms
+            return
+        
+        if self._proc is None:
+            self._proc = psutil.Process()
+        QThreadPool.globalInstance().start(MemProbe(self._proc, self._memory_signals))
+    
+    def _on_memory_probed(self, memory_mb):
+        """Update memory usage display with a finished probe result"""
+        # Log memory usage to debug system
+        self.debug_logger.log_memory_usage("Main Application", memory_mb)
+        
+        # Update status bar with memory usage - pass the float value directly
+        if hasattr(self, 'status_bar'):
+            self.status_bar.set_memory_usage(memory_mb)
+    
+    def _on_memory_probe_failed(self, error):
+        """Log a failed memory probe"""
+        self.debug_logger.error(LogCategory.MEMORY, f"Error updating memory usage: {error}")
     
     def handle_screen_change(self, screen=None):
         """Handle screen changes (resolution, DPI, etc.)"""
@@ -472,12 +526,8 @@ class RenderwareModdingSuite(QMainWindow):
     def refresh_ui_scaling(self):
         """Refresh the UI with new scaling"""
         try:
-            # Reapply the stylesheet with new scaling
-            theme = ModernDarkTheme()
-            QApplication.instance().setStyleSheet(theme.get_main_stylesheet())
-            
-            # Reapply dark palette to ensure theme consistency
-            theme.apply_dark_palette(QApplication.instance())
+            # Reapply the stylesheet with new scaling (also reapplies the dark palette)
+            ModernDarkTheme.apply(QApplication.instance())
             
             # Update font
             rm = get_responsive_manager()
@@ -544,12 +594,9 @@ def main():
     except Exception as e:
         debug_logger.error(LogCategory.UI, f"Error setting global application icon: {e}")
     
-    # Apply modern dark theme
+    # Apply modern dark theme (stylesheet and dark palette) at the application level
     theme = ModernDarkTheme()
-    app.setStyleSheet(theme.get_main_stylesheet())
-    
-    # Force dark palette to override any system theme interference
-    theme.apply_dark_palette(app)
+    theme.apply(app)
     debug_logger.info(LogCategory.UI, "Dark theme applied successfully")
     
     # Set responsive font with fallbacks
@@ -5,15 +5,23 @@ Inspired by VS Code and other modern development environments
 
 import sys
 import os
+import re
+from functools import lru_cache
 from application.debug_system import get_debug_logger, LogCategory
  
 # Module-level logger
 debug_logger = get_debug_logger()
 from .responsive_utils import get_responsive_manager
+from .common.resources import ICONS_DIR, load_text_resource
 
 
 def initialize_qt_resources():
     """Initialize Qt resources for compiled applications"""
+    from PyQt6.QtCore import QDir
+    
+    # Stylesheet icons are served from disk so Qt can cache them by URL
+    QDir.setSearchPaths("icons", [ICONS_DIR])
+    
     if getattr(sys, 'frozen', False):
         # Running as compiled executable
         try:
@@ -70,576 +78,568 @@ class ModernDarkTheme:
         """Apply dark palette to the application to override system theme"""
         from PyQt6.QtGui import QPalette, QColor
         
+        role = QPalette.ColorRole
+        colors = _THEME_COLORS
         dark_palette = QPalette()
-        # Background colors
-        dark_palette.setColor(QPalette.ColorRole.Window, QColor(ModernDarkTheme.BACKGROUND_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(ModernDarkTheme.TEXT_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.Base, QColor(ModernDarkTheme.BACKGROUND_SECONDARY))
-        dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(ModernDarkTheme.BACKGROUND_TERTIARY))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(ModernDarkTheme.BACKGROUND_TERTIARY))
-        dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(ModernDarkTheme.TEXT_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.Text, QColor(ModernDarkTheme.TEXT_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.Button, QColor(ModernDarkTheme.BUTTON_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(ModernDarkTheme.TEXT_PRIMARY))
-        dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(ModernDarkTheme.TEXT_ACCENT))
-        # Selection colors
-        dark_palette.setColor(QPalette.ColorRole.Link, QColor(ModernDarkTheme.TEXT_ACCENT))
-        dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(ModernDarkTheme.TEXT_ACCENT))
-        dark_palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
+        for color_role, color in (
+            # Background colors
+            (role.Window, colors['BACKGROUND_PRIMARY']),
+            (role.WindowText, colors['TEXT_PRIMARY']),
+            (role.Base, colors['BACKGROUND_SECONDARY']),
+            (role.AlternateBase, colors['BACKGROUND_TERTIARY']),
+            (role.ToolTipBase, colors['BACKGROUND_TERTIARY']),
+            (role.ToolTipText, colors['TEXT_PRIMARY']),
+            (role.Text, colors['TEXT_PRIMARY']),
+            (role.Button, colors['BUTTON_PRIMARY']),
+            (role.ButtonText, colors['TEXT_PRIMARY']),
+            (role.BrightText, colors['TEXT_ACCENT']),
+            # Selection colors
+            (role.Link, colors['TEXT_ACCENT']),
+            (role.Highlight, colors['TEXT_ACCENT']),
+            (role.HighlightedText, "#ffffff"),
+        ):
+            dark_palette.setColor(color_role, QColor(color))
+        
         # Disabled colors
-        dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, QColor(ModernDarkTheme.TEXT_SECONDARY))
-        dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, QColor(ModernDarkTheme.TEXT_SECONDARY))
-        dark_palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(ModernDarkTheme.TEXT_SECONDARY))
+        disabled_text = QColor(colors['TEXT_SECONDARY'])
+        for color_role in (role.WindowText, role.Text, role.ButtonText):
+            dark_palette.setColor(QPalette.ColorGroup.Disabled, color_role, disabled_text)
         
         app.setPalette(dark_palette)
     
+    @classmethod
+    def apply(cls, app):
+        """Apply the main stylesheet and dark palette to the whole application"""
+        global _applied_stylesheet
+        stylesheet = cls.get_main_stylesheet()
+        if stylesheet is _applied_stylesheet:
+            debug_logger.debug(LogCategory.UI, "Theme stylesheet already applied, skipping")
+            return
+        
+        app.setStyleSheet(stylesheet)
+        cls.apply_dark_palette(app)
+        _applied_stylesheet = stylesheet
+    
+    @staticmethod
+    def reset(app):
+        """Clear the application stylesheet, e.g. before switching themes"""
+        global _applied_stylesheet
+        app.setStyleSheet("")
+        _applied_stylesheet = None
+    
     @staticmethod
     def get_main_stylesheet():
         """Main application stylesheet with responsive sizing"""
         rm = get_responsive_manager()
-        fonts = rm.get_font_config()
-        spacing = rm.get_spacing_config()
-        button_size = rm.get_button_size()
-        
-        return f"""
-        QMainWindow {{
-            background-color: {ModernDarkTheme.BACKGROUND_PRIMARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-        }}
-        
-        /* Menu Bar Styles */
-        QMenuBar {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: none;
-            padding: {spacing['small']}px;
-            font-size: {fonts['menu']['size']}px;
-        }}
-        
-        QMenuBar::item {{
-            background-color: transparent;
-            padding: {spacing['small']}px {spacing['medium']}px;
-            border-radius: 4px;
-            margin: {spacing['small']//2}px;
-        }}
-        
-        QMenuBar::item:selected {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        QMenuBar::item:pressed {{
-            background-color: {ModernDarkTheme.TEXT_ACCENT};
-        }}
-        
-        QMenu {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            padding: {spacing['small']}px;
-            font-size: {fonts['menu']['size']}px;
-        }}
-        
-        QMenu::item {{
-            padding: {spacing['small']}px {spacing['medium']}px;
-            border-radius: 4px;
-        }}
-        
-        QMenu::item:selected {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        QMenu::separator {{
-            height: 1px;
-            background-color: {ModernDarkTheme.BORDER_SECONDARY};
-            margin: {spacing['small']}px {spacing['medium']}px;
-        }}
-        
-        /* Toolbar Styles */
-        QToolBar {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            border: none;
-            spacing: {spacing['small']}px;
-            padding: {spacing['small']}px;
-        }}
-        
-        QToolBar::separator {{
-            background-color: {ModernDarkTheme.BORDER_SECONDARY};
-            width: 1px;
-            margin: {spacing['small']}px {spacing['medium']}px;
-        }}
-        
-        /* Button Styles */
-        QPushButton {{
-            background-color: {ModernDarkTheme.BUTTON_PRIMARY};
-            color: white;
-            border: none;
-            padding: {spacing['small']}px {spacing['small'] + 2}px;
-            border-radius: 4px;
-            font-weight: 500;
-            font-size: {fonts['body']['size']}px;
-            min-width: {button_size[0]}px;
-            min-height: {button_size[1]}px;
-            max-height: {button_size[1] + 4}px;
-        }}
-        
-        QPushButton:hover {{
-            background-color: {ModernDarkTheme.BUTTON_HOVER};
-        }}
-        
-        QPushButton:pressed {{
-            background-color: {ModernDarkTheme.BUTTON_PRESSED};
-        }}
-        
-        QPushButton:disabled {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_SECONDARY};
-        }}
-        
-        /* Tree Widget Styles */
-        QTreeWidget {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: none;
-            outline: none;
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QTreeView {{
-            /* Ensure consistent indentation so branch indicators have breathing room */
-            indentation: {rm.get_scaled_size(16)}px;
-        }}
-        
-        QTreeWidget::item {{
-            padding: {spacing['small']}px;
-            border-bottom: 1px solid {ModernDarkTheme.BACKGROUND_TERTIARY};
-        }}
-        
-        QTreeWidget::item:selected {{
-            background-color: {ModernDarkTheme.SELECTION_COLOR};
-        }}
-        
-        QTreeWidget::item:hover {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        QTreeWidget::branch {{
-            background: transparent;
-        }}
-        QTreeView::branch {{
-            background: transparent;
-        }}
-        
-        QTreeWidget::branch:has-children {{
-            /* Add margin and fixed size so arrows align nicely */
-            margin: {spacing['small']//2}px;
-            width: {rm.get_scaled_size(12)}px;
-            height: {rm.get_scaled_size(12)}px;
-        }}
-        QTreeView::branch:has-children {{
-            margin: {spacing['small']//2}px;
-            width: {rm.get_scaled_size(12)}px;
-            height: {rm.get_scaled_size(12)}px;
-        }}
-
-        /* Hide indicator on leaf items to prevent filled squares */
-        QTreeWidget::branch:!has-children {{
-            image: none;
-            border-image: none;
-        }}
-        QTreeView::branch:!has-children {{
-            image: none;
-            border-image: none;
-        }}
-        
-        QTreeWidget::branch:closed:has-children {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBvbHlnb24gcG9pbnRzPSI0IDMgOCA2IDQgOSIgc3Ryb2tlPSIjY2NjY2NjIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgZmlsbD0ibm9uZSIvPgo8L3N2Zz4=);
-            border-image: none;
-        }}
-        QTreeView::branch:closed:has-children {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBvbHlnb24gcG9pbnRzPSI0IDMgOCA2IDQgOSIgc3Ryb2tlPSIjY2NjY2NjIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgZmlsbD0ibm9uZSIvPgo8L3N2Zz4=);
-            border-image: none;
-        }}
-        
-        QTreeWidget::branch:open:has-children {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBvbHlnb24gcG9pbnRzPSIzIDQgNiA4IDkgNCIgc3Ryb2tlPSIjY2NjY2NjIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgZmlsbD0ibm9uZSIvPgo8L3N2Zz4=);
-            border-image: none;
-        }}
-        QTreeView::branch:open:has-children {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBvbHlnb24gcG9pbnRzPSIzIDQgNiA4IDkgNCIgc3Ryb2tlPSIjY2NjY2NjIiBzdHJva2Utd2lkdGg9IjIiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIgZmlsbD0ibm9uZSIvPgo8L3N2Zz4=);
-            border-image: none;
-        }}
-        
-        /* Tab Widget Styles */
-        QTabWidget::pane {{
-            background-color: {ModernDarkTheme.BACKGROUND_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-        }}
-        
-        QTabBar::tab {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            padding: {spacing['small']}px {spacing['medium']}px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-            min-width: {rm.get_scaled_size(80)}px;
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QTabBar::tab:selected {{
-            background-color: {ModernDarkTheme.BACKGROUND_PRIMARY};
-            color: {ModernDarkTheme.TEXT_ACCENT};
-            border-bottom: 2px solid {ModernDarkTheme.TEXT_ACCENT};
-        }}
-        
-        QTabBar::tab:hover {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        QTabBar::close-button {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEyIDRMNCA5NU00IDRMMTIgMTIiIHN0cm9rZT0iI2NjY2NjYyIgc3Ryb2tlLXdpZHRoPSIxLjUiIHN0cm9rZS1saW5lY2FwPSJyb3VuZCIvPgo8L3N2Zz4K);
-            subcontrol-position: right;
-            subcontrol-origin: padding;
-            margin: {spacing['small']}px;
-            padding: 2px;
-            width: {rm.get_icon_size()}px;
-            height: {rm.get_icon_size()}px;
-            background-color: transparent;
-            border-radius: 2px;
-        }}
-        
-        QTabBar::close-button:hover {{
-            background-color: {ModernDarkTheme.TEXT_ERROR};
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTEyIDRMNCA5NU00IDRMMTIgMTIiIHN0cm9rZT0iI2ZmZmZmZiIgc3Ryb2tlLXdpZHRoPSIyIiBzdHJva2UtbGluZWNhcD0icm91bmQiLz4KPC9zdmc+);
-        }}
-        
-        QTabBar::close-button:pressed {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-        }}
-        
-        /* Text Edit Styles */
-        QTextEdit {{
-            background-color: {ModernDarkTheme.BACKGROUND_PRIMARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-            font-family: {fonts['code']['family']};
-            font-size: {fonts['code']['size']}px;
-            line-height: 1.4;
-            padding: {spacing['medium']}px;
-        }}
-        
-        QTextEdit:focus {{
-            border-color: {ModernDarkTheme.BORDER_ACCENT};
-        }}
-        
-        /* Scrollbar Styles */
-        QScrollBar:vertical {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            width: {rm.get_scaled_size(12)}px;
-            border: none;
-        }}
-        
-        QScrollBar::handle:vertical {{
-            background-color: {ModernDarkTheme.BORDER_SECONDARY};
-            border-radius: {rm.get_scaled_size(6)}px;
-            min-height: {rm.get_scaled_size(20)}px;
-            margin: 2px;
-        }}
-        
-        QScrollBar::handle:vertical:hover {{
-            background-color: {ModernDarkTheme.TEXT_SECONDARY};
-        }}
-        
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            height: 0px;
-        }}
-        
-        QScrollBar:horizontal {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            height: {rm.get_scaled_size(12)}px;
-            border: none;
-        }}
-        
-        QScrollBar::handle:horizontal {{
-            background-color: {ModernDarkTheme.BORDER_SECONDARY};
-            border-radius: {rm.get_scaled_size(6)}px;
-            min-width: {rm.get_scaled_size(20)}px;
-            margin: 2px;
-        }}
-        
-        QScrollBar::handle:horizontal:hover {{
-            background-color: {ModernDarkTheme.TEXT_SECONDARY};
-        }}
-        
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            width: 0px;
-        }}
-        
-        /* Status Bar Styles */
-        QStatusBar {{
-            background-color: {ModernDarkTheme.TEXT_ACCENT};
-            color: white;
-            border: none;
-            font-size: {fonts['status']['size']}px;
-            padding: {spacing['small']}px;
-        }}
-        
-        /* ComboBox Styles */
-        QComboBox {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            padding: {spacing['small']}px {spacing['medium']}px;
-            border-radius: 4px;
-            min-width: {rm.get_scaled_size(120)}px;
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QComboBox:hover {{
-            border-color: {ModernDarkTheme.BORDER_ACCENT};
-        }}
-        
-        QComboBox::drop-down {{
-            border: none;
-            width: {rm.get_scaled_size(20)}px;
-        }}
-        
-        QComboBox::down-arrow {{
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTYiIGhlaWdodD0iMTYiIHZpZXdCb3g9IjAgMCAxNiAxNiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTQgNkw4IDEwTDEyIDZINFoiIGZpbGw9IiNjY2NjY2MiLz4KPC9zdmc+);
-        }}
-        
-        QComboBox QAbstractItemView {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            selection-background-color: {ModernDarkTheme.TEXT_ACCENT};
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        /* Progress Bar Styles */
-        QProgressBar {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            border-radius: 4px;
-            text-align: center;
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            height: {rm.get_scaled_size(20)}px;
-            font-size: {fonts['small']['size']}px;
-        }}
-        
-        QProgressBar::chunk {{
-            background-color: {ModernDarkTheme.TEXT_ACCENT};
-            border-radius: 3px;
-        }}
-        
-        /* Splitter Styles */
-        QSplitter::handle {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-        }}
-        
-        QSplitter::handle:horizontal {{
-            width: {spacing['small']}px;
-        }}
-        
-        QSplitter::handle:vertical {{
-            height: {spacing['small']}px;
-        }}
-        
-        QSplitter::handle:hover {{
-            background-color: {ModernDarkTheme.BORDER_ACCENT};
-        }}
-        
-        /* Frame Styles */
-        QFrame#sidebarFrame {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            border-right: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-        }}
-        
-        /* Label Styles */
-        QLabel {{
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QLabel#titleLabel {{
-            color: {ModernDarkTheme.TEXT_ACCENT};
-            font-weight: bold;
-            font-size: {fonts['header']['size']}px;
-        }}
-        
-        QLabel#sectionLabel {{
-            color: {ModernDarkTheme.TEXT_SUCCESS};
-            font-weight: bold;
-            font-size: {fonts['subheader']['size']}px;
-            margin: {spacing['medium']}px 0 {spacing['small']}px 0;
-        }}
-        
-        /* List Widget Styles */
-        QListWidget {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-            outline: none;
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QListWidget::item {{
-            padding: {spacing['small']}px;
-            border-bottom: 1px solid {ModernDarkTheme.BACKGROUND_TERTIARY};
-        }}
-        
-        QListWidget::item:selected {{
-            background-color: {ModernDarkTheme.SELECTION_COLOR};
-        }}
-        
-        QListWidget::item:hover {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        /* Group Box Styles */
-        QGroupBox {{
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            border-radius: 4px;
-            margin-top: {spacing['medium']}px;
-            font-size: {fonts['subheader']['size']}px;
-            font-weight: bold;
-        }}
-        
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            left: {spacing['medium']}px;
-            padding: 0 {spacing['small']}px 0 {spacing['small']}px;
-        }}
-        
-        /* Table Widget Styles */
-        QTableWidget {{
-            background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            gridline-color: {ModernDarkTheme.BORDER_SECONDARY};
-            border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-            outline: none;
-            font-size: {fonts['body']['size']}px;
-        }}
-        
-        QTableWidget::item {{
-            padding: {spacing['small']}px;
-        }}
-        
-        QTableWidget::item:selected {{
-            background-color: {ModernDarkTheme.SELECTION_COLOR};
-        }}
-        
-        QTableWidget::item:hover {{
-            background-color: {ModernDarkTheme.HOVER_COLOR};
-        }}
-        
-        QHeaderView::section {{
-            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-            color: {ModernDarkTheme.TEXT_PRIMARY};
-            padding: {spacing['medium']}px;
-            border: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
-            font-size: {fonts['body']['size']}px;
-            font-weight: bold;
-        }}
-        """
+        return _build_main_stylesheet(rm.scale_factor, rm.breakpoint)
     
     @staticmethod
     def get_welcome_html():
         """HTML content for the welcome tab with responsive sizing"""
         rm = get_responsive_manager()
-        fonts = rm.get_font_config()
-        spacing = rm.get_spacing_config()
-        
-        # Adjust layout based on screen size
-        if rm.breakpoint == "small":
-            container_padding = spacing['medium']
-            title_size = fonts['header']['size'] + 4
-            subtitle_size = fonts['subheader']['size']
-            body_size = fonts['body']['size']
-            flex_direction = "column"  # Stack vertically on small screens
-            section_margin = spacing['small']
-        else:
-            container_padding = spacing['large']
-            title_size = fonts['header']['size'] + 6
-            subtitle_size = fonts['subheader']['size'] + 1
-            body_size = fonts['body']['size']
-            flex_direction = "row"  # Side by side on larger screens
-            section_margin = spacing['medium']
-        
-        return f"""
-        <div style="color: {ModernDarkTheme.TEXT_PRIMARY}; font-size: {body_size}px; padding: {container_padding}px; font-family: 'Segoe UI', Arial, sans-serif;">
-            <div style="text-align: center; margin-bottom: {spacing['xlarge'] * 2}px;">
-                <h1 style="color: {ModernDarkTheme.TEXT_ACCENT}; font-size: {title_size}px; margin-bottom: {spacing['medium']}px;">
-                    ⚡ Renderware Modding Suite
-                </h1>
-                <p style="color: {ModernDarkTheme.TEXT_SECONDARY}; font-size: {subtitle_size}px;">
-                    Professional modding tools for 3D era Grand Theft Auto games
-                </p>
-            </div>
-            
-            <div style="display: flex; flex-direction: {flex_direction}; justify-content: space-between; margin-bottom: {spacing['xlarge']}px; gap: {spacing['large']}px;">
-                <div style="flex: 1;">
-                    <h3 style="color: {ModernDarkTheme.TEXT_SUCCESS}; margin-bottom: {spacing['medium']}px; font-size: {fonts['subheader']['size']}px;">🎮 Supported Games</h3>
-                    <ul style="list-style: none; padding: 0;">
-                        <li style="margin-bottom: {spacing['medium']}px; padding: {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_SECONDARY}; border-radius: 4px;">
-                            <strong style="color: {ModernDarkTheme.TEXT_ACCENT}; font-size: {body_size}px;">GTA III (2001)</strong><br>
-                            <span style="color: {ModernDarkTheme.TEXT_SECONDARY}; font-size: {fonts['small']['size']}px;">Liberty City - Where it all began</span>
-                        </li>
-                        <li style="margin-bottom: {spacing['medium']}px; padding: {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_SECONDARY}; border-radius: 4px;">
-                            <strong style="color: {ModernDarkTheme.TEXT_ACCENT}; font-size: {body_size}px;">GTA Vice City (2002)</strong><br>
-                            <span style="color: {ModernDarkTheme.TEXT_SECONDARY}; font-size: {fonts['small']['size']}px;">80s Miami nostalgia and neon lights</span>
-                        </li>
-                        <li style="padding: {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_SECONDARY}; border-radius: 4px;">
-                            <strong style="color: {ModernDarkTheme.TEXT_ACCENT}; font-size: {body_size}px;">GTA San Andreas (2004)</strong><br>
-                            <span style="color: {ModernDarkTheme.TEXT_SECONDARY}; font-size: {fonts['small']['size']}px;">The biggest adventure across three cities</span>
-                        </li>
-                    </ul>
-                </div>
-                
-                <div style="flex: 1;">
-                    <h3 style="color: {ModernDarkTheme.TEXT_SUCCESS}; margin-bottom: {spacing['medium']}px; font-size: {fonts['subheader']['size']}px;">📁 Supported Formats</h3>
-                    <ul style="list-style: none; padding: 0;">
-                        <li style="margin-bottom: {spacing['small']}px; padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_ACCENT}; font-size: {fonts['small']['size']}px;">
-                            <strong>DFF</strong> - 3D Models and meshes
-                        </li>
-                        <li style="margin-bottom: {spacing['small']}px; padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_SUCCESS}; font-size: {fonts['small']['size']}px;">
-                            <strong>TXD</strong> - Texture dictionaries
-                        </li>
-                        <li style="margin-bottom: {spacing['small']}px; padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_WARNING}; font-size: {fonts['small']['size']}px;">
-                            <strong>COL</strong> - Collision data
-                        </li>
-                        <li style="margin-bottom: {spacing['small']}px; padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_ERROR}; font-size: {fonts['small']['size']}px;">
-                            <strong>IFP</strong> - Animation files
-                        </li>
-                        <li style="margin-bottom: {spacing['small']}px; padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_ACCENT}; font-size: {fonts['small']['size']}px;">
-                            <strong>IDE</strong> - Item definition files
-                        </li>
-                        <li style="padding: {spacing['small']}px {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 4px; border-left: 3px solid {ModernDarkTheme.TEXT_SUCCESS}; font-size: {fonts['small']['size']}px;">
-                            <strong>IPL</strong> - Item placement files
-                        </li>
-                    </ul>
-                </div>
-            </div>
-            
-            <div style="background-color: {ModernDarkTheme.BACKGROUND_SECONDARY}; padding: {spacing['large']}px; border-radius: 8px; border-left: 4px solid {ModernDarkTheme.TEXT_ACCENT}; margin-bottom: {spacing['xlarge']}px;">
-                <h3 style="color: {ModernDarkTheme.TEXT_SUCCESS}; margin-bottom: {spacing['medium']}px; font-size: {fonts['subheader']['size']}px;">🚀 Getting Started</h3>
-                <ol style="color: {ModernDarkTheme.TEXT_SECONDARY}; line-height: 1.6; font-size: {body_size}px;">
-                    <li><strong>Select your target game</strong> from the tools panel on the left</li>
-                    <li><strong>Choose the appropriate tool</strong> for your modding task</li>
-                    <li><strong>Load your game files</strong> and start creating amazing mods!</li>
-                </ol>
-            </div>
-            
-            <div style="text-align: center; margin-top: {spacing['xlarge'] * 2}px;">
-                <p style="color: {ModernDarkTheme.TEXT_ACCENT}; font-size: {subtitle_size}px; font-style: italic;">
-                    🌟 Ready to bring your creative vision to the streets of Liberty City, Vice City, and San Andreas! 🌟
-                </p>
-                <div style="margin-top: {spacing['large']}px; padding: {spacing['medium']}px; background-color: {ModernDarkTheme.BACKGROUND_TERTIARY}; border-radius: 8px;">
-                    <p style="color: {ModernDarkTheme.TEXT_WARNING}; font-size: {fonts['small']['size']}px; margin: 0;">
-                        ⚠️ Development Status: Frontend Complete | Backend Placeholder | File Parsers In Progress
-                    </p>
-                </div>
-            </div>
-        </div>
-        """
+        return _build_welcome_html(rm.scale_factor, rm.breakpoint)
+
+
+# Stylesheet currently set on the QApplication by ModernDarkTheme.apply()
+_applied_stylesheet = None
+
+# Theme colours keyed by constant name, resolved once for template rendering
+_THEME_COLORS = {name: value for name, value in vars(ModernDarkTheme).items() if name.isupper()}
+
+# Static stylesheet source; only the named placeholders vary at runtime.
+# The welcome page template lives in resources/welcome.html.
+_MAIN_STYLESHEET_TEMPLATE = """
+    QMainWindow {{
+        background-color: {BACKGROUND_PRIMARY};
+        color: {TEXT_PRIMARY};
+    }}
+    
+    /* Menu Bar Styles */
+    QMenuBar {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        border: none;
+        padding: {spacing_small}px;
+        font-size: {font_menu}px;
+    }}
+    
+    QMenuBar::item {{
+        background-color: transparent;
+        padding: {spacing_small}px {spacing_medium}px;
+        border-radius: 4px;
+        margin: {spacing_small_half}px;
+    }}
+    
+    QMenuBar::item:selected {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    QMenuBar::item:pressed {{
+        background-color: {TEXT_ACCENT};
+    }}
+    
+    QMenu {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_SECONDARY};
+        padding: {spacing_small}px;
+        font-size: {font_menu}px;
+    }}
+    
+    QMenu::item {{
+        padding: {spacing_small}px {spacing_medium}px;
+        border-radius: 4px;
+    }}
+    
+    QMenu::item:selected {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    QMenu::separator {{
+        height: 1px;
+        background-color: {BORDER_SECONDARY};
+        margin: {spacing_small}px {spacing_medium}px;
+    }}
+    
+    /* Toolbar Styles */
+    QToolBar {{
+        background-color: {BACKGROUND_TERTIARY};
+        border: none;
+        spacing: {spacing_small}px;
+        padding: {spacing_small}px;
+    }}
+    
+    QToolBar::separator {{
+        background-color: {BORDER_SECONDARY};
+        width: 1px;
+        margin: {spacing_small}px {spacing_medium}px;
+    }}
+    
+    /* Button Styles */
+    QPushButton {{
+        background-color: {BUTTON_PRIMARY};
+        color: white;
+        border: none;
+        padding: {spacing_small}px {spacing_small_plus2}px;
+        border-radius: 4px;
+        font-weight: 500;
+        font-size: {font_body}px;
+        min-width: {button_width}px;
+        min-height: {button_height}px;
+        max-height: {button_height_tall}px;
+    }}
+    
+    QPushButton:hover {{
+        background-color: {BUTTON_HOVER};
+    }}
+    
+    QPushButton:pressed {{
+        background-color: {BUTTON_PRESSED};
+    }}
+    
+    QPushButton:disabled {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_SECONDARY};
+    }}
+    
+    /* Tree Widget Styles */
+    QTreeWidget {{
+        background-color: {BACKGROUND_SECONDARY};
+        color: {TEXT_PRIMARY};
+        border: none;
+        outline: none;
+        font-size: {font_body}px;
+    }}
+    
+    QTreeView {{
+        /* Ensure consistent indentation so branch indicators have breathing room */
+        indentation: {size_16}px;
+    }}
+    
+    QTreeWidget::item {{
+        padding: {spacing_small}px;
+        border-bottom: 1px solid {BACKGROUND_TERTIARY};
+    }}
+    
+    QTreeWidget::item:selected {{
+        background-color: {SELECTION_COLOR};
+    }}
+    
+    QTreeWidget::item:hover {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    /* QTreeView rules also cover QTreeWidget, which derives from it */
+    QTreeView::branch {{
+        background: transparent;
+    }}
+    
+    QTreeView::branch:has-children {{
+        /* Add margin and fixed size so arrows align nicely */
+        margin: {spacing_small_half}px;
+        width: {size_12}px;
+        height: {size_12}px;
+    }}
+
+    /* Hide indicator on leaf items to prevent filled squares */
+    QTreeView::branch:!has-children {{
+        image: none;
+        border-image: none;
+    }}
+    
+    QTreeView::branch:closed:has-children {{
+        image: url(icons:branch_closed.svg);
+        border-image: none;
+    }}
+    
+    QTreeView::branch:open:has-children {{
+        image: url(icons:branch_open.svg);
+        border-image: none;
+    }}
+    
+    /* Tab Widget Styles */
+    QTabWidget::pane {{
+        background-color: {BACKGROUND_PRIMARY};
+        border: 1px solid {BORDER_PRIMARY};
+    }}
+    
+    QTabBar::tab {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        padding: {spacing_small}px {spacing_medium}px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        min-width: {size_80}px;
+        font-size: {font_body}px;
+    }}
+    
+    QTabBar::tab:selected {{
+        background-color: {BACKGROUND_PRIMARY};
+        color: {TEXT_ACCENT};
+        border-bottom: 2px solid {TEXT_ACCENT};
+    }}
+    
+    QTabBar::tab:hover {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    QTabBar::close-button {{
+        image: url(icons:tab_close.svg);
+        subcontrol-position: right;
+        subcontrol-origin: padding;
+        margin: {spacing_small}px;
+        padding: 2px;
+        width: {icon_size}px;
+        height: {icon_size}px;
+        background-color: transparent;
+        border-radius: 2px;
+    }}
+    
+    QTabBar::close-button:hover {{
+        background-color: {TEXT_ERROR};
+        image: url(icons:tab_close_hover.svg);
+    }}
+    
+    QTabBar::close-button:pressed {{
+        background-color: {BACKGROUND_TERTIARY};
+    }}
+    
+    /* Text Edit Styles */
+    QTextEdit {{
+        background-color: {BACKGROUND_PRIMARY};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_PRIMARY};
+        font-family: {font_code_family};
+        font-size: {font_code}px;
+        line-height: 1.4;
+        padding: {spacing_medium}px;
+    }}
+    
+    QTextEdit:focus {{
+        border-color: {BORDER_ACCENT};
+    }}
+    
+    /* Scrollbar Styles */
+    QScrollBar:vertical, QScrollBar:horizontal {{
+        background-color: {BACKGROUND_SECONDARY};
+        border: none;
+    }}
+    
+    QScrollBar:vertical {{
+        width: {size_12}px;
+    }}
+    
+    QScrollBar:horizontal {{
+        height: {size_12}px;
+    }}
+    
+    QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
+        background-color: {BORDER_SECONDARY};
+        border-radius: {size_6}px;
+        margin: 2px;
+    }}
+    
+    QScrollBar::handle:vertical {{
+        min-height: {size_20}px;
+    }}
+    
+    QScrollBar::handle:horizontal {{
+        min-width: {size_20}px;
+    }}
+    
+    QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {{
+        background-color: {TEXT_SECONDARY};
+    }}
+    
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0px;
+    }}
+    
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
+        width: 0px;
+    }}
+    
+    /* Status Bar Styles */
+    QStatusBar {{
+        background-color: {TEXT_ACCENT};
+        color: white;
+        border: none;
+        font-size: {font_status}px;
+        padding: {spacing_small}px;
+    }}
+    
+    /* ComboBox Styles */
+    QComboBox {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_SECONDARY};
+        padding: {spacing_small}px {spacing_medium}px;
+        border-radius: 4px;
+        min-width: {size_120}px;
+        font-size: {font_body}px;
+    }}
+    
+    QComboBox:hover {{
+        border-color: {BORDER_ACCENT};
+    }}
+    
+    QComboBox::drop-down {{
+        border: none;
+        width: {size_20}px;
+    }}
+    
+    QComboBox::down-arrow {{
+        image: url(icons:combo_down_arrow.svg);
+    }}
+    
+    QComboBox QAbstractItemView {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_SECONDARY};
+        selection-background-color: {TEXT_ACCENT};
+        font-size: {font_body}px;
+    }}
+    
+    /* Progress Bar Styles */
+    QProgressBar {{
+        background-color: {BACKGROUND_TERTIARY};
+        border: 1px solid {BORDER_SECONDARY};
+        border-radius: 4px;
+        text-align: center;
+        color: {TEXT_PRIMARY};
+        height: {size_20}px;
+        font-size: {font_small}px;
+    }}
+    
+    QProgressBar::chunk {{
+        background-color: {TEXT_ACCENT};
+        border-radius: 3px;
+    }}
+    
+    /* Splitter Styles */
+    QSplitter::handle {{
+        background-color: {BACKGROUND_TERTIARY};
+    }}
+    
+    QSplitter::handle:horizontal {{
+        width: {spacing_small}px;
+    }}
+    
+    QSplitter::handle:vertical {{
+        height: {spacing_small}px;
+    }}
+    
+    QSplitter::handle:hover {{
+        background-color: {BORDER_ACCENT};
+    }}
+    
+    /* Frame Styles */
+    QFrame#sidebarFrame {{
+        background-color: {BACKGROUND_SECONDARY};
+        border-right: 1px solid {BORDER_PRIMARY};
+    }}
+    
+    /* Label Styles */
+    QLabel {{
+        color: {TEXT_PRIMARY};
+        font-size: {font_body}px;
+    }}
+    
+    QLabel#titleLabel {{
+        color: {TEXT_ACCENT};
+        font-weight: bold;
+        font-size: {font_header}px;
+        padding: {spacing_small}px;
+    }}
+    
+    QLabel#sectionLabel {{
+        color: {TEXT_SUCCESS};
+        font-weight: bold;
+        font-size: {font_subheader}px;
+        margin: {spacing_medium}px 0 {spacing_small}px 0;
+    }}
+    
+    QLabel#viewerHeader {{
+        font-weight: bold;
+        font-size: {size_16}px;
+        padding: {size_10}px;
+    }}
+    
+    QLabel#viewerHeader[severity="error"] {{
+        color: {TEXT_ERROR};
+    }}
+    
+    /* List Widget Styles */
+    QListWidget {{
+        background-color: {BACKGROUND_SECONDARY};
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_PRIMARY};
+        outline: none;
+        font-size: {font_body}px;
+    }}
+    
+    QListWidget::item {{
+        padding: {spacing_small}px;
+        border-bottom: 1px solid {BACKGROUND_TERTIARY};
+    }}
+    
+    QListWidget::item:selected {{
+        background-color: {SELECTION_COLOR};
+    }}
+    
+    QListWidget::item:hover {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    /* Group Box Styles */
+    QGroupBox {{
+        color: {TEXT_PRIMARY};
+        border: 1px solid {BORDER_SECONDARY};
+        border-radius: 4px;
+        margin-top: {spacing_medium}px;
+        font-size: {font_subheader}px;
+        font-weight: bold;
+    }}
+    
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: {spacing_medium}px;
+        padding: 0 {spacing_small}px 0 {spacing_small}px;
+    }}
+    
+    /* Table Widget Styles */
+    QTableWidget {{
+        background-color: {BACKGROUND_SECONDARY};
+        color: {TEXT_PRIMARY};
+        gridline-color: {BORDER_SECONDARY};
+        border: 1px solid {BORDER_PRIMARY};
+        outline: none;
+        font-size: {font_body}px;
+    }}
+    
+    QTableWidget::item {{
+        padding: {spacing_small}px;
+    }}
+    
+    QTableWidget::item:selected {{
+        background-color: {SELECTION_COLOR};
+    }}
+    
+    QTableWidget::item:hover {{
+        background-color: {HOVER_COLOR};
+    }}
+    
+    QHeaderView::section {{
+        background-color: {BACKGROUND_TERTIARY};
+        color: {TEXT_PRIMARY};
+        padding: {spacing_medium}px;
+        border: 1px solid {BORDER_SECONDARY};
+        font-size: {font_body}px;
+        font-weight: bold;
+    }}
+    """
+
+
+
+def _responsive_values(rm):
+    """Theme colours plus the font and spacing sizes of the current scale"""
+    values = dict(_THEME_COLORS)
+    values.update({f"font_{name}": config['size'] for name, config in rm.get_font_config().items()})
+    values.update({f"spacing_{name}": size for name, size in rm.get_spacing_config().items()})
+    return values
+
+
+def _minify_qss(qss):
+    """Strip comments and redundant whitespace so Qt parses less text"""
+    qss = re.sub(r'/\*.*?\*/', '', qss, flags=re.S)
+    qss = re.sub(r'\s+', ' ', qss)
+    return re.sub(r'\s*([{};,])\s*', r'\1', qss).strip()
+
+
+# The stylesheet and welcome page only depend on the responsive scale and
+# breakpoint, so each rendering is cached per (scale_factor, breakpoint).
+@lru_cache(maxsize=8)
+def _build_main_stylesheet(scale_factor, breakpoint):
+    """Render the main stylesheet for one responsive configuration"""
+    rm = get_responsive_manager()
+    values = _responsive_values(rm)
+    button_width, button_height = rm.get_button_size()
+    values.update({f"size_{base}": rm.get_scaled_size(base) for base in (6, 10, 12, 16, 20, 80, 120)})
+    values.update(
+        font_code_family=rm.get_font_config()['code']['family'],
+        icon_size=rm.get_icon_size(),
+        button_width=button_width,
+        button_height=button_height,
+        button_height_tall=button_height + 4,
+        spacing_small_half=values['spacing_small'] // 2,
+        spacing_small_plus2=values['spacing_small'] + 2,
+    )
+    return _minify_qss(_MAIN_STYLESHEET_TEMPLATE.format_map(values))
+
+
+@lru_cache(maxsize=8)
+def _build_welcome_html(scale_factor, breakpoint):
+    """Render the welcome tab HTML for one responsive configuration"""
+    rm = get_responsive_manager()
+    values = _responsive_values(rm)
+    values['spacing_xlarge_double'] = values['spacing_xlarge'] * 2
+    
+    # Adjust layout based on screen size
+    if rm.breakpoint == "small":
+        values.update(
+            container_padding=values['spacing_medium'],
+            title_size=values['font_header'] + 4,
+            subtitle_size=values['font_subheader'],
+            flex_direction="column",  # Stack vertically on small screens
+        )
+    else:
+        values.update(
+            container_padding=values['spacing_large'],
+            title_size=values['font_header'] + 6,
+            subtitle_size=values['font_subheader'] + 1,
+            flex_direction="row",  # Side by side on larger screens
+        )
+    values['body_size'] = values['font_body']
+    
+    return load_text_resource("welcome.html").format_map(values)
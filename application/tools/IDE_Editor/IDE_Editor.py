@@ -7,7 +7,7 @@ import sys
 import os
 import json
 from pathlib import Path
-from functools import partial
+from functools import partial, lru_cache
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFileDialog, QListWidget, QListWidgetItem, 
@@ -36,6 +36,55 @@ debug_logger = get_debug_logger()
 
 # --- Custom Widget for Collapsible Panels ---
 
+@lru_cache(maxsize=8)
+def _collapsible_panel_styles(scale_factor, breakpoint):
+    """Header and toolbar button stylesheets shared by every CollapsiblePanel"""
+    rm = get_responsive_manager()
+    fonts = rm.get_font_config()
+    spacing = rm.get_spacing_config()
+    button_size = rm.get_button_size()
+
+    header_style = f"""
+        QPushButton {{
+            text-align: left;
+            padding: {spacing['small']}px;
+            font-weight: bold;
+            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
+            color: {ModernDarkTheme.TEXT_PRIMARY};
+            border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
+            border-radius: 4px;
+            font-size: {fonts['subheader']['size']}px;
+        }}
+        QPushButton:hover {{
+            background-color: {ModernDarkTheme.HOVER_COLOR};
+        }}
+    """
+    button_style = f"""
+        QPushButton {{
+            background-color: {ModernDarkTheme.BUTTON_PRIMARY};
+            color: white;
+            border: none;
+            padding: {spacing['small']}px {spacing['small'] + 2}px;
+            border-radius: 4px;
+            font-weight: 500;
+            font-size: {fonts['body']['size']}px;
+            min-width: {button_size[0]}px;
+            min-height: {button_size[1]}px;
+        }}
+        QPushButton:hover {{
+            background-color: {ModernDarkTheme.BUTTON_HOVER};
+        }}
+        QPushButton:pressed {{
+            background-color: {ModernDarkTheme.BUTTON_PRESSED};
+        }}
+        QPushButton:disabled {{
+            background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
+            color: {ModernDarkTheme.TEXT_SECONDARY};
+        }}
+    """
+    return header_style, button_style
+
+
 class CollapsiblePanel(QWidget):
     """
     A collapsible widget that now includes a toolbar for actions
@@ -47,26 +96,11 @@ class CollapsiblePanel(QWidget):
         
         # Get responsive configuration
         rm = get_responsive_manager()
-        fonts = rm.get_font_config()
         spacing = rm.get_spacing_config()
-        button_size = rm.get_button_size()
+        header_style, button_style = _collapsible_panel_styles(rm.scale_factor, rm.breakpoint)
 
         self.header_button = QPushButton(title)
-        self.header_button.setStyleSheet(f"""
-            QPushButton {{
-                text-align: left;
-                padding: {spacing['small']}px;
-                font-weight: bold;
-                background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-                color: {ModernDarkTheme.TEXT_PRIMARY};
-                border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
-                border-radius: 4px;
-                font-size: {fonts['subheader']['size']}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ModernDarkTheme.HOVER_COLOR};
-            }}
-        """)
+        self.header_button.setStyleSheet(header_style)
         self.header_button.clicked.connect(self.toggle_expanded)
 
         self.content_area = QWidget()
@@ -83,30 +117,6 @@ class CollapsiblePanel(QWidget):
         self.delete_row_button = QPushButton("Delete Selected")
         
         # Apply suite styling to buttons
-        button_style = f"""
-            QPushButton {{
-                background-color: {ModernDarkTheme.BUTTON_PRIMARY};
-                color: white;
-                border: none;
-                padding: {spacing['small']}px {spacing['small'] + 2}px;
-                border-radius: 4px;
-                font-weight: 500;
-                font-size: {fonts['body']['size']}px;
-                min-width: {button_size[0]}px;
-                min-height: {button_size[1]}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ModernDarkTheme.BUTTON_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: {ModernDarkTheme.BUTTON_PRESSED};
-            }}
-            QPushButton:disabled {{
-                background-color: {ModernDarkTheme.BACKGROUND_TERTIARY};
-                color: {ModernDarkTheme.TEXT_SECONDARY};
-            }}
-        """
-        
         self.add_row_button.setStyleSheet(button_style)
         self.delete_row_button.setStyleSheet(button_style)
         
@@ -118,6 +128,7 @@ class CollapsiblePanel(QWidget):
         self.animation = QPropertyAnimation(self.content_area, b"maximumHeight")
         self.animation.setDuration(200)
         self.animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self.animation.finished.connect(self._on_animation_finished)
 
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(0)
@@ -137,6 +148,7 @@ class CollapsiblePanel(QWidget):
         self.is_expanded = not self.is_expanded
 
         if self.is_expanded:
+            self.content_area.setVisible(True)
             end_height = self.content_area.sizeHint().height()
         
         self.animation.setStartValue(start_height)
@@ -144,6 +156,11 @@ class CollapsiblePanel(QWidget):
         self.animation.start()
         self._update_arrow()
 
+    def _on_animation_finished(self):
+        # A collapsed section is hidden so layouts skip its table entirely
+        if not self.is_expanded:
+            self.content_area.setVisible(False)
+
     def _update_arrow(self):
         arrow = "▼" if self.is_expanded else "►"
         title = self.header_button.text().lstrip("▼► ").strip()
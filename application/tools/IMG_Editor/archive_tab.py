@@ -4,7 +4,7 @@ This interim shim allows us to refactor imports before moving implementations.
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 
 from application.common.message_box import message_box
 from application.styles import ModernDarkTheme
@@ -95,16 +95,7 @@ class IMGArchiveTab(QWidget):
 
     def get_selected_entries(self):
         """Get currently selected entries"""
-        selected_entries = []
-
-        # Get all selected rows
-        for index in self.entries_table.selectedIndexes():
-            if index.column() == 0:  # Only count each row once
-                entry = self.entries_table.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
-                if entry:
-                    selected_entries.append(entry)
-
-        return selected_entries
+        return self.entries_table.get_selected_entries()
 
     def _on_filter_changed(self, filter_text, filter_type, filter_rw_version):
         """Handle filter changes"""
@@ -228,7 +219,7 @@ class IMGArchiveTab(QWidget):
 
             # Clear table data
             if hasattr(self, 'entries_table'):
-                self.entries_table.setRowCount(0)
+                self.entries_table.clear_entries()
 
             debug_logger.info(LogCategory.UI, "IMGArchiveTab cleanup completed")
 
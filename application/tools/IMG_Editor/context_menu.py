@@ -3,7 +3,6 @@ Context menu functionality for IMG Editor table entries
 """
 
 from PyQt6.QtWidgets import QMenu, QApplication
-from PyQt6.QtCore import Qt
 from .img_integrations import IMGToolIntegration
 from application.debug_system import get_debug_logger, LogCategory
 debug_logger = get_debug_logger()
@@ -22,30 +21,24 @@ class IMGTableContextMenu:
         
     def show_context_menu(self, position):
         """Show context menu for table items"""
-        item = self.table.itemAt(position)
-        if not item:
+        index = self.table.indexAt(position)
+        if not index.isValid():
             return
         
-        # Get the entry from the first column of the row
-        row = item.row()
-        name_item = self.table.item(row, 0)
-        if not name_item:
-            return
-            
-        entry = name_item.data(Qt.ItemDataRole.UserRole)
+        # Get the entry behind the clicked row
+        entry = self.table.entry_at(index)
         if not entry:
             return
         
         menu = QMenu(self.table)
         
-        # Get selected items count
-        selected_items = self.table.selectedItems()
-        selected_rows = set(item.row() for item in selected_items)
+        # Get selected rows
+        selected_rows = set(index.row() for index in self.table.selected_rows())
         
         # Rename action (only for single selection)
         if len(selected_rows) == 1:
             rename_action = menu.addAction("Rename")
-            rename_action.triggered.connect(lambda: self._rename_entry(name_item))
+            rename_action.triggered.connect(lambda: self._rename_entry(index))
             menu.addSeparator()
         
         # Copy entry info action
@@ -67,10 +60,9 @@ class IMGTableContextMenu:
         # Show menu at cursor position
         menu.exec(self.table.mapToGlobal(position))
     
-    def _rename_entry(self, name_item):
+    def _rename_entry(self, index):
         """Start editing the entry name"""
-        if name_item:
-            self.table.editItem(name_item)
+        self.table.start_rename(index)
     
     def _copy_entry_info(self, selected_rows):
         """Copy information about selected entries to clipboard"""
@@ -79,20 +71,14 @@ class IMGTableContextMenu:
         
         info_lines = []
         
+        model = self.table.model()
         for row in sorted(selected_rows):
-            name_item = self.table.item(row, 0)
-            type_item = self.table.item(row, 1)
-            size_item = self.table.item(row, 2)
-            offset_item = self.table.item(row, 3)
-            rw_version_item = self.table.item(row, 4)
-            
-            if name_item:
-                entry = name_item.data(Qt.ItemDataRole.UserRole)
-                name = name_item.text() if name_item else "Unknown"
-                file_type = type_item.text() if type_item else "Unknown"
-                size = size_item.text() if size_item else "0"
-                offset = offset_item.text() if offset_item else "0"
-                rw_version = rw_version_item.text() if rw_version_item else "N/A"
+            if self.table.entry_at(model.index(row, 0)):
+                name = model.index(row, 0).data() or "Unknown"
+                file_type = model.index(row, 1).data() or "Unknown"
+                size = model.index(row, 2).data() or "0"
+                offset = model.index(row, 3).data() or "0"
+                rw_version = model.index(row, 4).data() or "N/A"
                 
                 info_lines.append(f"Name: {name}")
                 info_lines.append(f"Type: {file_type}")
@@ -113,21 +99,7 @@ class IMGTableContextMenu:
     
     def _select_inverse(self):
         """Select all unselected rows and deselect selected ones"""
-        # Get currently selected rows
-        selected_items = self.table.selectedItems()
-        selected_rows = set(item.row() for item in selected_items)
-        
-        # Clear current selection
-        self.table.clearSelection()
-        
-        # Select all rows that weren't previously selected
-        for row in range(self.table.rowCount()):
-            if row not in selected_rows:
-                # Select entire row
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setSelected(True)
+        self.table.select_inverse()
     
     def _select_none(self):
         """Clear all selections"""
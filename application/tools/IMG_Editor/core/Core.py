@@ -35,6 +35,12 @@ MAX_FILENAME_LENGTH = 24
 
 class IMGEntry:
     """Represents a single entry in an IMG archive."""
+    # Archives hold thousands of entries; slots keep each one small
+    __slots__ = (
+        'offset', 'streaming_size', 'size', 'name', 'is_compressed', 'data',
+        '_rw_version', '_rw_version_name', '_format_info', 'is_new_entry',
+    )
+
     def __init__(self):
         self.offset = 0          # Offset in sectors (multiply by 2048 for actual byte offset)
         self.streaming_size = 0  # Size in sectors for streaming (V2 only)
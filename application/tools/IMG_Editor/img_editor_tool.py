@@ -6,6 +6,7 @@ Provides the ImgEditorTool UI for managing IMG archives with tabs.
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -35,6 +36,42 @@ from application.debug_system import get_debug_logger, LogCategory
 # Module-level debug logger
 debug_logger = get_debug_logger()
 
+# Size policy shared by widgets that grow in both directions
+_EXPANDING = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+# Button icons by name, loaded from application/resources/icons on first use
+_ICONS = {}
+
+
+def _tool_icon(name):
+    """Shared QIcon for an icon in the icons: search path"""
+    icon = _ICONS.get(name)
+    if icon is None:
+        icon = _ICONS[name] = QIcon(f"icons:{name}.svg")
+    return icon
+
+
+# IMG tools tabs: (tab title, group title, column spacing, row spacing, button rows).
+# Each row lists (label, handle_img_tool action, icon) buttons; None leaves a grid cell empty.
+_TOOL_GROUPS = (
+    ("📁 File", "File Operations", 15, None, (
+        (("Create New", "Create New IMG", "img_new"), ("Open IMG", "Open IMG", "img_open")),
+        (("Open Multiple", "Open Multiple Files", "img_open_multiple"), ("Close IMG", "Close IMG", "img_close")),
+        (("Close All", "Close All", "img_close_all"), ("Mod Status", "Show Modification Status", "img_mod_status")),
+    )),
+    ("⚙️ IMG", "IMG Operations", 15, None, (
+        (("Rebuild", "Rebuild IMG", "img_rebuild"), ("Rebuild All", "Rebuild All", "img_rebuild_all")),
+        (("Merge IMG", "Merge IMG", "img_merge"), ("Split IMG", "Split IMG", "img_split")),
+        (("Convert Format", "Convert Format", "img_convert"), ("Compress", "Compress IMG", "img_compress")),
+    )),
+    ("📤 Import/Export", "Import/Export", 10, 5, (
+        (("Import Via IDE", "Import Via IDE", "img_import_ide"), ("Export All", "Export All", "img_export_all")),
+        (("Import Files", "Import Files", "img_import_files"), ("Export Selected", "Export Selected", "img_export_selected")),
+        (("Import Folder", "Import Folder", "img_import_folder"), ("Export by Type", "Export by Type", "img_export_by_type")),
+        (("Import Preview", "Import Preview", "img_import_preview"), None),
+    )),
+)
+
 
 class ImgEditorTool(QWidget):
     """IMG Editor tool interface with multi-archive tab support"""
@@ -47,6 +84,8 @@ class ImgEditorTool(QWidget):
         super().__init__(parent)
         self.img_controller = IMGController()
         self.current_archive_tab = None
+        # Open archive tabs by the file path they were opened with
+        self._archive_tabs_by_path = {}
 
         # Initialize drag and drop handler
         self.drag_drop_handler = DragDropHandler(self)
@@ -485,7 +524,7 @@ class ImgEditorTool(QWidget):
 
         self.setLayout(main_layout)
         self.setMinimumHeight(rm.get_scaled_size(400))
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setSizePolicy(_EXPANDING)
 
     def create_left_panel(self):
         """Create the left panel with tabbed archives"""
@@ -628,6 +667,7 @@ class ImgEditorTool(QWidget):
 
         # Add tab
         tab_index = self.archive_tabs.addTab(archive_tab, tab_title)
+        self._archive_tabs_by_path[file_path] = archive_tab
 
         # Set as current tab
         self.archive_tabs.setCurrentIndex(tab_index)
@@ -651,17 +691,12 @@ class ImgEditorTool(QWidget):
 
     def switch_to_archive(self, file_path):
         """Switch to a specific archive tab"""
-        if not file_path:
+        archive_tab = self._archive_tabs_by_path.get(file_path)
+        if archive_tab is None:
             return False
 
-        for i in range(self.archive_tabs.count()):
-            widget = self.archive_tabs.widget(i)
-            if isinstance(widget, IMGArchiveTab):
-                widget_file_path = self.img_controller.get_archive_file_path(widget.img_archive)
-                if widget_file_path == file_path:
-                    self.archive_tabs.setCurrentIndex(i)
-                    return True
-        return False
+        self.archive_tabs.setCurrentWidget(archive_tab)
+        return True
 
     def _close_archive_tab(self, index):
         """Close an archive tab"""
@@ -674,6 +709,11 @@ class ImgEditorTool(QWidget):
                 except Exception as e:
                     debug_logger.log_exception(LogCategory.UI, "Error during archive tab cleanup", e)
 
+            # Forget the tab first so the controller's img_closed signal does not remove it again
+            self._archive_tabs_by_path = {
+                path: tab for path, tab in self._archive_tabs_by_path.items() if tab is not widget
+            }
+
             # Remove from controller
             file_path = self.img_controller.get_archive_file_path(widget.img_archive)
             if file_path:  # Only try to close if file_path is not None
@@ -716,26 +756,28 @@ class ImgEditorTool(QWidget):
                     except Exception as e:
                         debug_logger.log_exception(LogCategory.UI, "Error during archive tab cleanup", e)
 
-            # Remove all tabs
-            while self.archive_tabs.count() > 0:
-                self.archive_tabs.removeTab(0)
+            # Remove all tabs without a currentChanged round-trip per removed tab
+            self.archive_tabs.blockSignals(True)
+            try:
+                while self.archive_tabs.count() > 0:
+                    self.archive_tabs.removeTab(0)
+            finally:
+                self.archive_tabs.blockSignals(False)
+            self._archive_tabs_by_path.clear()
+            self.current_archive_tab = None
             self.show_empty_state()
         else:
             # Find and remove specific tab
-            for i in range(self.archive_tabs.count()):
-                widget = self.archive_tabs.widget(i)
-                if isinstance(widget, IMGArchiveTab):
-                    widget_file_path = self.img_controller.get_archive_file_path(widget.img_archive)
-                    if widget_file_path == file_path:
-                        # Clean up the archive tab
-                        if hasattr(widget, 'cleanup'):
-                            try:
-                                widget.cleanup()
-                            except Exception as e:
-                                debug_logger.log_exception(LogCategory.UI, "Error during archive tab cleanup", e)
-
-                        self.archive_tabs.removeTab(i)
-                        break
+            widget = self._archive_tabs_by_path.pop(file_path, None)
+            if widget is not None:
+                # Clean up the archive tab
+                if hasattr(widget, 'cleanup'):
+                    try:
+                        widget.cleanup()
+                    except Exception as e:
+                        debug_logger.log_exception(LogCategory.UI, "Error during archive tab cleanup", e)
+
+                self.archive_tabs.removeTab(self.archive_tabs.indexOf(widget))
 
             if self.archive_tabs.count() == 0:
                 self.show_empty_state()
@@ -769,15 +811,12 @@ class ImgEditorTool(QWidget):
             return
 
         # Update tab title to show modified state
-        for i in range(self.archive_tabs.count()):
-            widget = self.archive_tabs.widget(i)
-            if isinstance(widget, IMGArchiveTab):
-                widget_file_path = self.img_controller.get_archive_file_path(widget.img_archive)
-                if widget_file_path == file_path:
-                    current_title = self.archive_tabs.tabText(i)
-                    if not current_title.endswith("*"):
-                        self.archive_tabs.setTabText(i, current_title + "*")
-                    break
+        archive_tab = self._archive_tabs_by_path.get(file_path)
+        if archive_tab is not None:
+            i = self.archive_tabs.indexOf(archive_tab)
+            current_title = self.archive_tabs.tabText(i)
+            if not current_title.endswith("*"):
+                self.archive_tabs.setTabText(i, current_title + "*")
 
     def _on_tab_action_requested(self, action_name, data):
         """Handle action requests from tabs"""
@@ -837,16 +876,11 @@ class ImgEditorTool(QWidget):
         actions_group = QGroupBox("⚡ Quick Actions")
         actions_layout = QGridLayout()
 
-        extract_btn = QPushButton("📤 Extract")
-        extract_btn.clicked.connect(lambda: self.handle_img_tool("Extract Selected"))
-        delete_btn = QPushButton("🗑️ Delete")
-        delete_btn.clicked.connect(lambda: self.handle_img_tool("Delete Selected"))
-        rebuild_btn = QPushButton("🔄 Rebuild")
-        rebuild_btn.clicked.connect(lambda: self.handle_img_tool("Rebuild"))
-        import_btn = QPushButton("📥 Import")
-        import_btn.clicked.connect(lambda: self.handle_img_tool("Import Files"))
-        select_all_btn = QPushButton("✔️ Select All")
-        select_all_btn.clicked.connect(lambda: self.handle_img_tool("Select All"))
+        extract_btn = self._mk_btn("Extract", "Extract Selected", "img_extract")
+        delete_btn = self._mk_btn("Delete", "Delete Selected", "img_delete")
+        rebuild_btn = self._mk_btn("Rebuild", "Rebuild", "img_rebuild")
+        import_btn = self._mk_btn("Import", "Import Files", "img_import_files")
+        select_all_btn = self._mk_btn("Select All", "Select All", "img_select_all")
 
         # Add buttons to grid layout
         actions_layout.addWidget(extract_btn, 0, 0)
@@ -860,17 +894,17 @@ class ImgEditorTool(QWidget):
 
         # IMG Tools Section
         tools_group = self.create_tools_section()
-
-        # Wrap tools in a scroll area
-        tools_scroll = QScrollArea()
-        tools_scroll.setWidget(tools_group)
-        tools_scroll.setWidgetResizable(True)
-        tools_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-
-        right_layout.addWidget(tools_scroll, 1)
+        right_layout.addWidget(tools_group, 1)
 
         right_panel.setLayout(right_layout)
-        return right_panel
+
+        # The whole panel scrolls when the window is too short for it
+        right_scroll = QScrollArea()
+        right_scroll.setWidget(right_panel)
+        right_scroll.setWidgetResizable(True)
+        right_scroll.setFrameShape(QFrame.Shape.NoFrame)
+        right_scroll.setMinimumWidth(right_panel.minimumWidth())
+        return right_scroll
 
     def create_tools_section(self):
         """Create the tools section with a tabbed interface for better space management"""
@@ -910,218 +944,108 @@ class ImgEditorTool(QWidget):
             }}
         """)
 
-        # File Operations Tab
-        file_tab = QWidget()
-        file_layout = QVBoxLayout(file_tab)
-        self.create_file_operations_group(file_layout)
-        tab_widget.addTab(file_tab, "📁 File")
-
-        # IMG Operations Tab
-        img_tab = QWidget()
-        img_layout = QVBoxLayout(img_tab)
-        self.create_img_operations_group(img_layout)
-        tab_widget.addTab(img_tab, "⚙️ IMG")
+        # Tab pages start empty; each one's buttons are built the first time it is shown
+        self.tools_tabs = tab_widget
+        self._tool_tab_builders = {}
+        for tab_title, *group in _TOOL_GROUPS:
+            tab_page = QWidget()
+            QVBoxLayout(tab_page)
+            self._tool_tab_builders[tab_widget.addTab(tab_page, tab_title)] = group
 
-        # Import/Export Tab
-        import_tab = QWidget()
-        import_layout = QVBoxLayout(import_tab)
-        self.create_import_export_group(import_layout)
-        tab_widget.addTab(import_tab, "📤 Import/Export")
+        tab_widget.currentChanged.connect(self._build_tool_tab)
+        self._build_tool_tab(tab_widget.currentIndex())
 
         tools_layout.addWidget(tab_widget)
         tools_group.setLayout(tools_layout)
 
         # Set size policies
         tools_group.setMinimumHeight(rm.get_scaled_size(250))  # Reduced minimum height
-        tools_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        tools_group.setSizePolicy(_EXPANDING)
 
         return tools_group
 
-    def create_file_operations_group(self, parent_layout):
-        """Create File Operations tool group"""
-        file_ops_group = QGroupBox("File Operations")
+    def _mk_btn(self, label, action, icon=None):
+        """Create a tool button that runs handle_img_tool(action) when clicked"""
+        button = QPushButton(_tool_icon(icon), label) if icon is not None else QPushButton(label)
+        button.setProperty('action', action)
+        button.clicked.connect(self._on_tool_btn)
+        return button
+
+    def _on_tool_btn(self):
+        """Dispatch a tool button click to handle_img_tool"""
+        self.handle_img_tool(self.sender().property('action'))
+
+    def _build_tool_tab(self, index):
+        """Build a tools tab's buttons the first time the tab is shown"""
+        group = self._tool_tab_builders.pop(index, None)
+        if group is not None:
+            self._build_group(self.tools_tabs.widget(index).layout(), *group)
+
+    def _build_group(self, parent_layout, title, column_spacing, row_spacing, rows):
+        """Create a tool group box with its buttons laid out in a grid"""
+        group_box = QGroupBox(title)
         rm = get_responsive_manager()
 
-        # Main grid layout for buttons
-        file_grid = QGridLayout()
-        # Set horizontal spacing between columns
-        file_grid.setHorizontalSpacing(rm.get_scaled_size(15))
-        # Set vertical spacing between rows
-
-        # Create buttons
-        create_new_btn = QPushButton("📄 Create New")
-        create_new_btn.clicked.connect(lambda: self.handle_img_tool("Create New IMG"))
-
-        open_img_btn = QPushButton("📂 Open IMG")
-        open_img_btn.clicked.connect(lambda: self.handle_img_tool("Open IMG"))
-
-        open_multiple_btn = QPushButton("📂 Open Multiple")
-        open_multiple_btn.clicked.connect(lambda: self.handle_img_tool("Open Multiple Files"))
-
-        close_img_btn = QPushButton("❌ Close IMG")
-        close_img_btn.clicked.connect(lambda: self.handle_img_tool("Close IMG"))
-
-        close_all_btn = QPushButton("❌ Close All")
-        close_all_btn.clicked.connect(lambda: self.handle_img_tool("Close All"))
-
-        # Modification status button
-        mod_status_btn = QPushButton("📊 Mod Status")
-        mod_status_btn.clicked.connect(lambda: self.handle_img_tool("Show Modification Status"))
-
-        # Add buttons to grid - using a 3x3 grid for better organization
-        file_grid.addWidget(create_new_btn, 0, 0)
-        file_grid.addWidget(open_img_btn, 0, 1)
-
-        file_grid.addWidget(open_multiple_btn, 1, 0)
-        file_grid.addWidget(close_img_btn, 1, 1)
-
-        file_grid.addWidget(close_all_btn, 2, 0)
-        file_grid.addWidget(mod_status_btn, 2, 1)
-        file_ops_group.setLayout(file_grid)
-
-        # Add to parent layout
-        parent_layout.addWidget(file_ops_group)
-
-    def create_img_operations_group(self, parent_layout):
-        """Create IMG Operations tool group"""
-        img_ops_group = QGroupBox("IMG Operations")
-        rm = get_responsive_manager()
-
-        img_grid = QGridLayout()
-        # Set horizontal spacing between columns
-        img_grid.setHorizontalSpacing(rm.get_scaled_size(15))
-        # Set vertical spacing between rows
-
-        rebuild_btn = QPushButton("🔨 Rebuild")
-        rebuild_btn.clicked.connect(lambda: self.handle_img_tool("Rebuild IMG"))
-
-        rebuild_all_btn = QPushButton("🔨 Rebuild All")
-        rebuild_all_btn.clicked.connect(lambda: self.handle_img_tool("Rebuild All"))
-
-        merge_btn = QPushButton("🔗 Merge IMG")
-        merge_btn.clicked.connect(lambda: self.handle_img_tool("Merge IMG"))
-
-        split_btn = QPushButton("✂️ Split IMG")
-        split_btn.clicked.connect(lambda: self.handle_img_tool("Split IMG"))
-
-        convert_btn = QPushButton("🔄 Convert Format")
-        convert_btn.clicked.connect(lambda: self.handle_img_tool("Convert Format"))
-
-        compress_btn = QPushButton("🗜️ Compress")
-        compress_btn.clicked.connect(lambda: self.handle_img_tool("Compress IMG"))
-
-        # Add buttons to grid
-        img_grid.addWidget(rebuild_btn, 0, 0)
-        img_grid.addWidget(rebuild_all_btn, 0, 1)
-        img_grid.addWidget(merge_btn, 1, 0)
-        img_grid.addWidget(split_btn, 1, 1)
-        img_grid.addWidget(convert_btn, 2, 0)
-        img_grid.addWidget(compress_btn, 2, 1)
-
-        img_ops_group.setLayout(img_grid)
-
-        # Add to parent layout
-        parent_layout.addWidget(img_ops_group)
-
-    def create_import_export_group(self, parent_layout):
-        """Create Import/Export tool group"""
-        import_export_group = QGroupBox("Import/Export")
-        rm = get_responsive_manager()
-
-        import_grid = QGridLayout()
-        # Set horizontal spacing between columns
-        import_grid.setHorizontalSpacing(rm.get_scaled_size(10))
-        # Set vertical spacing between rows
-        import_grid.setVerticalSpacing(5)
-
-        # Import buttons
-        import_file_btn = QPushButton("📥 Import Via IDE")
-        import_file_btn.clicked.connect(lambda: self.handle_img_tool("Import Via IDE"))
-
-        import_files_btn = QPushButton("📥 Import Files")
-        import_files_btn.clicked.connect(lambda: self.handle_img_tool("Import Files"))
-
-        import_folder_btn = QPushButton("📁 Import Folder")
-        import_folder_btn.clicked.connect(lambda: self.handle_img_tool("Import Folder"))
-
-        import_preview_btn = QPushButton("👁️ Import Preview")
-        import_preview_btn.clicked.connect(lambda: self.handle_img_tool("Import Preview"))
-
-        # Export buttons
-        export_all_btn = QPushButton("📤 Export All")
-        export_all_btn.clicked.connect(lambda: self.handle_img_tool("Export All"))
-
-        export_selected_btn = QPushButton("📤 Export Selected")
-        export_selected_btn.clicked.connect(lambda: self.handle_img_tool("Export Selected"))
-
-        export_by_type_btn = QPushButton("📤 Export by Type")
-        export_by_type_btn.clicked.connect(lambda: self.handle_img_tool("Export by Type"))
-
-        # Add buttons to grid (3 columns now)
-        import_grid.addWidget(import_file_btn, 0, 0)
-        import_grid.addWidget(import_files_btn, 1, 0)
-        import_grid.addWidget(import_folder_btn, 2, 0)
-        import_grid.addWidget(import_preview_btn, 3, 0)
-
-        import_grid.addWidget(export_all_btn, 0, 1)
-        import_grid.addWidget(export_selected_btn, 1, 1)
-        import_grid.addWidget(export_by_type_btn, 2, 1)
-
-        import_export_group.setLayout(import_grid)
-
-        # Add to parent layout
-        parent_layout.addWidget(import_export_group)
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(rm.get_scaled_size(column_spacing))
+        if row_spacing is not None:
+            grid.setVerticalSpacing(row_spacing)
+
+        for row, buttons in enumerate(rows):
+            for column, button in enumerate(buttons):
+                if button is not None:
+                    grid.addWidget(self._mk_btn(*button), row, column)
+
+        group_box.setLayout(grid)
+        parent_layout.addWidget(group_box)
+
+    # handle_img_tool dispatch: action name -> handler method name
+    _TOOL_HANDLERS = {
+        "Open IMG": "_open_img_file",
+        "Open Multiple Files": "_open_multiple_img_files",
+        "Close IMG": "_close_current_img",
+        "Close All": "_close_all_imgs",
+        "Create New IMG": "_create_new_img",
+        "Extract Selected": "_extract_selected",
+        "Delete Selected": "_delete_selected",
+        # Import actions
+        "Import Via IDE": "_import_Via_IDE",
+        "Import Files": "_import_multiple_files",
+        "Import Folder": "_import_folder",
+        "Import Preview": "_get_import_preview",
+        "Show Modification Status": "_show_modification_status",
+        # Export actions
+        "Export All": "_export_all",
+        "Export Selected": "_export_selected",
+        "Export by Type": "_export_by_type",
+        "Rebuild": "_rebuild_img",
+        "Rebuild IMG": "_rebuild_img",
+        "Rebuild All": "_rebuild_all_imgs",
+    }
 
     def handle_img_tool(self, tool_name):
         """Handle IMG tool action"""
-        # Handle different tool actions using imported handlers
-        if tool_name == "Open IMG":
-            self._open_img_file()
-        elif tool_name == "Open Multiple Files":
-            self._open_multiple_img_files()
-        elif tool_name == "Close IMG":
-            self._close_current_img()
-        elif tool_name == "Close All":
-            self._close_all_imgs()
-        elif tool_name == "Create New IMG":
-            self._create_new_img()
-        elif tool_name == "Extract Selected":
-            self._extract_selected()
-        elif tool_name == "Delete Selected":
-            self._delete_selected()
-        # Import actions
-        elif tool_name == "Import Via IDE":
-            self._import_Via_IDE()
-        elif tool_name == "Import Files":
-            self._import_multiple_files()
-        elif tool_name == "Import Folder":
-            self._import_folder()
-        elif tool_name == "Import Preview":
-            self._get_import_preview()
-        elif tool_name == "Show Modification Status":
-            self._show_modification_status()
-        # Export actions
-        elif tool_name == "Export All":
-            self._export_all()
-        elif tool_name == "Export Selected":
-            self._export_selected()
-        elif tool_name == "Export by Type":
-            self._export_by_type()
-        elif tool_name in ["Rebuild", "Rebuild IMG"]:
-            # Trigger rebuild of the active archive
-            if not self.img_controller.get_active_archive():
-                message_box.warning("No IMG file is currently open.", "No IMG Open", self)
-                return
-            self.progress_panel.start_operation("Rebuilding archive")
-            success, message = self.img_controller.rebuild_img()
-            if not success:
-                message_box.error(message, "Rebuild Failed", self)
-        elif tool_name == "Rebuild All":
-            message_box.info("Rebuild All is not implemented yet.", "Not Implemented", self)
+        handler_name = self._TOOL_HANDLERS.get(tool_name)
+        if handler_name:
+            getattr(self, handler_name)()
         else:
             # For other tools not yet implemented
             message_box.info(f"The '{tool_name}' feature is not implemented yet.", "Feature Not Implemented", self)
 
+    def _rebuild_img(self):
+        """Trigger rebuild of the active archive"""
+        if not self.img_controller.get_active_archive():
+            message_box.warning("No IMG file is currently open.", "No IMG Open", self)
+            return
+        self.progress_panel.start_operation("Rebuilding archive")
+        success, message = self.img_controller.rebuild_img()
+        if not success:
+            message_box.error(message, "Rebuild Failed", self)
+
+    def _rebuild_all_imgs(self):
+        """Rebuild every open archive (not implemented yet)"""
+        message_box.info("Rebuild All is not implemented yet.", "Not Implemented", self)
+
     # Progress signal handlers
     def _on_operation_progress(self, percentage, message):
         """Handle operation progress updates."""
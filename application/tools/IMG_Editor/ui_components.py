@@ -8,8 +8,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QGroupBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QFileDialog,
     QAbstractItemView,
@@ -17,7 +16,18 @@ from PyQt6.QtWidgets import (
     QComboBox,
     QLineEdit,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QUrl
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QMimeData,
+    QUrl,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QItemSelection,
+    QItemSelectionModel,
+    QTimer,
+)
 from PyQt6.QtGui import QDrag
 import os
 
@@ -154,8 +164,159 @@ class IMGFileInfoPanel(QGroupBox):
             self.needs_save_label.setStyleSheet("color: white;")
 
 
-class IMGEntriesTable(QTableWidget, DragDropMixin):
-    """Enhanced table widget for IMG entries with drag and drop support"""
+# Item data roles exposed by IMGEntriesModel
+ENTRY_ROLE = Qt.ItemDataRole.UserRole  # The IMGEntry object behind a row (any column)
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1  # Raw value used for column sorting
+
+
+class IMGEntriesModel(QAbstractTableModel):
+    """Table model over an IMG entry list, with per-column data kept in parallel lists"""
+    rename_requested = pyqtSignal(object, str)  # entry, new name
+
+    HEADERS = ('Name', 'Type', 'Size', 'Offset', 'RW Version', 'Streaming', 'Compression')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._names = []
+        self._name_keys = []  # Lower-cased names for sorting and searching
+        self._types = []
+        self._sizes = []
+
+    def set_entries(self, entries):
+        """Replace all rows with the given entries"""
+        self.beginResetModel()
+        self._entries = list(entries or [])
+        self._names = [entry.name for entry in self._entries]
+        self._name_keys = [name.lower() for name in self._names]
+        self._types = [entry.type for entry in self._entries]
+        self._sizes = [entry.actual_size for entry in self._entries]
+        self.endResetModel()
+
+    def entry(self, row):
+        """Return the entry shown in a source row"""
+        return self._entries[row]
+
+    def row_matches(self, row, filter_text, filter_type, filter_rw_version):
+        """Check a source row against the filter panel's criteria (filter_text lower-cased)"""
+        if filter_text and filter_text not in self._name_keys[row]:
+            return False
+        if filter_type and self._types[row] != filter_type:
+            return False
+        if filter_rw_version:
+            entry = self._entries[row]
+            if filter_rw_version == "RenderWare Only":
+                return entry.is_renderware_file()
+            return entry.rw_version_name == filter_rw_version
+        return True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index) | Qt.ItemFlag.ItemIsDragEnabled
+        if index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsEditable  # Only the name can be renamed
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            if column == 0:
+                return self._names[row]
+            if column == 1:
+                return self._types[row]
+            if column == 2:
+                return f"{self._sizes[row]:,}"
+            entry = self._entries[row]
+            if column == 3:
+                return f"{entry.offset}"
+            if column == 4:
+                if getattr(entry, 'rw_version_name', None):
+                    return entry.rw_version_name
+                return "Unknown"
+            if column == 5:
+                # For V2 archives, show streaming size, otherwise show dash
+                if getattr(entry, 'streaming_size', 0) > 0:
+                    return f"{entry.streaming_size}"
+                return "-"
+            return "Yes" if entry.is_compressed else "No"
+
+        if role == ENTRY_ROLE:
+            return self._entries[row]
+
+        if role == SORT_ROLE:
+            if column == 0:
+                return self._name_keys[row]
+            if column == 2:
+                return self._sizes[row]
+            if column == 3:
+                return self._entries[row].offset
+            if column == 5:
+                return getattr(self._entries[row], 'streaming_size', 0)
+            return self.data(index, Qt.ItemDataRole.DisplayRole)
+
+        if role == Qt.ItemDataRole.ToolTipRole and column == 4:
+            entry = self._entries[row]
+            if getattr(entry, 'rw_version_name', None):
+                if entry.is_renderware_file() and entry.rw_version is not None:
+                    return f"RW Version: 0x{entry.rw_version:X}"
+                if "COL" in entry.rw_version_name:
+                    return f"Collision file: {entry.rw_version_name}"
+                return "Not a standard RenderWare file"
+            return "Version not analyzed"
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """Turn a finished name edit into a rename request; the archive owns the name"""
+        if role != Qt.ItemDataRole.EditRole or index.column() != 0:
+            return False
+
+        new_name = str(value).strip()
+        row = index.row()
+        if new_name and new_name != self._names[row]:
+            self.rename_requested.emit(self._entries[row], new_name)
+        return True
+
+
+class IMGEntriesFilterProxy(QSortFilterProxyModel):
+    """Sorts the entries model and hides rows that do not match the filter panel"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_text = ""
+        self._filter_type = None
+        self._filter_rw_version = None
+
+    def set_filter(self, filter_text=None, filter_type=None, filter_rw_version=None):
+        """Set the filter criteria and re-filter once"""
+        self._filter_text = (filter_text or "").lower()
+        self._filter_type = filter_type if filter_type != "All" else None
+        self._filter_rw_version = filter_rw_version if filter_rw_version != "All Versions" else None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().row_matches(
+            source_row, self._filter_text, self._filter_type, self._filter_rw_version
+        )
+
+
+class IMGEntriesTable(QTableView, DragDropMixin):
+    """Enhanced table view for IMG entries with drag and drop support"""
     entry_double_clicked = pyqtSignal(object)
     entry_selected = pyqtSignal(object)
     entry_renamed = pyqtSignal(object, str)  # Signal when entry is renamed
@@ -164,20 +325,25 @@ class IMGEntriesTable(QTableWidget, DragDropMixin):
 
     def __init__(self, parent=None):
         """Initialize the table with responsive styling"""
-        QTableWidget.__init__(self, parent)
+        QTableView.__init__(self, parent)
         DragDropMixin.__init__(self)
 
         rm = get_responsive_manager()
         fonts = rm.get_font_config()
         spacing = rm.get_spacing_config()
 
-        self.setColumnCount(7)
-        self.setHorizontalHeaderLabels(['Name', 'Type', 'Size', 'Offset', 'RW Version', 'Streaming', 'Compression'])
+        # Entries live in the model; the proxy handles sorting and filtering
+        self.entries_model = IMGEntriesModel(self)
+        self.proxy_model = IMGEntriesFilterProxy(self)
+        self.proxy_model.setSourceModel(self.entries_model)
+        self.proxy_model.setSortRole(SORT_ROLE)
+        self.proxy_model.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setModel(self.proxy_model)
 
         # Setup table properties
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         # Prevent user-initiated editing (e.g., double-click). Programmatic edits still allowed.
         self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
@@ -192,24 +358,28 @@ class IMGEntriesTable(QTableWidget, DragDropMixin):
         header = self.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
+        # Uniform row heights: rows are never measured from their contents
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setWordWrap(False)
+
         # Initialize drag and drop properties
         self.current_archive = None
         self.img_controller = None
 
         # Add responsive styling
         self.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 background-color: {ModernDarkTheme.BACKGROUND_SECONDARY};
                 gridline-color: {ModernDarkTheme.BORDER_SECONDARY};
                 border: 1px solid {ModernDarkTheme.BORDER_PRIMARY};
                 border-radius: 4px;
                 font-size: {fonts['body']['size']}px;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: {spacing['small']}px;
                 border-bottom: 1px solid {ModernDarkTheme.BORDER_SECONDARY};
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {ModernDarkTheme.TEXT_ACCENT};
                 color: white;
             }}
@@ -224,14 +394,12 @@ class IMGEntriesTable(QTableWidget, DragDropMixin):
         """)
 
         # Connect signals
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.itemSelectionChanged.connect(self._on_selection_changed)
-        self.itemChanged.connect(self._on_item_changed)
-
-        # Track editing state
-        self._is_editing = False
-        self._editing_item = None
-        self._old_name = None
+        self.doubleClicked.connect(self._on_item_double_clicked)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        # Queued so the table is not repopulated while the editor is still committing
+        self.entries_model.rename_requested.connect(
+            self.entry_renamed.emit, Qt.ConnectionType.QueuedConnection
+        )
 
         # Initialize context menu handler (will be set by parent)
         self.context_menu_handler = None
@@ -260,163 +428,74 @@ class IMGEntriesTable(QTableWidget, DragDropMixin):
         if self.context_menu_handler:
             self.context_menu_handler.show_context_menu(position)
 
-    def _on_item_double_clicked(self, item):
+    def entry_at(self, index):
+        """Return the entry for a view index, or None"""
+        if not index.isValid():
+            return None
+        return index.data(ENTRY_ROLE)
+
+    def selected_rows(self):
+        """Return the selected view rows as column 0 indexes, in view order"""
+        return sorted(self.selectionModel().selectedRows(0), key=lambda index: index.row())
+
+    def get_selected_entries(self):
+        """Return the entries of all selected rows"""
+        return [index.data(ENTRY_ROLE) for index in self.selected_rows()]
+
+    def _on_item_double_clicked(self, index):
         """Handle double-click on entry"""
-        row = item.row()
-        # Get the entry from the table's row data
-        entry = self.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        entry = self.entry_at(index)
         if entry:
             self.entry_double_clicked.emit(entry)
 
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, selected=None, deselected=None):
         """Handle selection change"""
-        selected_entries = []
-
-        # Get all selected rows
-        for index in self.selectedIndexes():
-            if index.column() == 0:  # Only count each row once
-                entry = self.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
-                if entry:
-                    selected_entries.append(entry)
-
+        selected_entries = self.get_selected_entries()
         if selected_entries:
             self.entry_selected.emit(selected_entries)
 
     def populate_entries(self, entries):
         """Populate table with entries"""
-        self.setRowCount(0)  # Clear the table
-
-        if not entries:
-            return
-
-        # Disable sorting temporarily for better performance
+        # One model reset and one sort; nothing is painted until both are done
+        self.setUpdatesEnabled(False)
         self.setSortingEnabled(False)
-
-        for entry in entries:
-            row = self.rowCount()
-            self.insertRow(row)
-
-            # Set entry data
-            name_item = QTableWidgetItem(entry.name)
-            name_item.setData(Qt.ItemDataRole.UserRole, entry)  # Store entry object in the item
-            name_item.setFlags(name_item.flags() | Qt.ItemFlag.ItemIsEditable)  # Make name editable
-
-            type_item = QTableWidgetItem(entry.type)
-            size_item = QTableWidgetItem(f"{entry.actual_size:,}")
-            offset_item = QTableWidgetItem(f"{entry.offset}")
-
-            # RenderWare version information
-            if hasattr(entry, 'rw_version_name') and entry.rw_version_name:
-                rw_version_item = QTableWidgetItem(entry.rw_version_name)
-                # Color code based on version type
-                if entry.is_renderware_file() and entry.rw_version is not None:
-                    rw_version_item.setToolTip(f"RW Version: 0x{entry.rw_version:X}")
-                elif entry.rw_version_name and "COL" in entry.rw_version_name:
-                    rw_version_item.setToolTip(f"Collision file: {entry.rw_version_name}")
-                else:
-                    rw_version_item.setToolTip("Not a standard RenderWare file")
-            else:
-                rw_version_item = QTableWidgetItem("Unknown")
-                rw_version_item.setToolTip("Version not analyzed")
-
-            # For V2 archives, show streaming size, otherwise show dash
-            if hasattr(entry, 'streaming_size') and entry.streaming_size > 0:
-                streaming_item = QTableWidgetItem(f"{entry.streaming_size}")
-            else:
-                streaming_item = QTableWidgetItem("-")
-
-            # Compression status
-            comp_item = QTableWidgetItem("Yes" if entry.is_compressed else "No")
-
-            # Add items to the row
-            self.setItem(row, 0, name_item)
-            self.setItem(row, 1, type_item)
-            self.setItem(row, 2, size_item)
-            self.setItem(row, 3, offset_item)
-            self.setItem(row, 4, rw_version_item)
-            self.setItem(row, 5, streaming_item)
-            self.setItem(row, 6, comp_item)
-
-        self.setSortingEnabled(True)
-        self.sortByColumn(0, Qt.SortOrder.AscendingOrder)  # Sort by name initially
-
-    def _on_item_changed(self, item):
-        """Handle item changes (mainly for renaming)"""
-        if not self._is_editing:
+        try:
+            self.entries_model.set_entries(entries)
+        finally:
+            self.setSortingEnabled(True)
+            self.sortByColumn(0, Qt.SortOrder.AscendingOrder)  # Sort by name initially
+            self.setUpdatesEnabled(True)
+
+    def clear_entries(self):
+        """Remove all entries from the table"""
+        self.entries_model.set_entries([])
+
+    def start_rename(self, index):
+        """Open the inline name editor for the row of a view index"""
+        if index.isValid():
+            self.edit(index.siblingAtColumn(0))
+
+    def select_inverse(self):
+        """Invert the row selection"""
+        rows = self.proxy_model.rowCount()
+        if not rows:
             return
-
-        # Check if this is the name column
-        if item.column() == 0 and self._editing_item == item:
-            entry = item.data(Qt.ItemDataRole.UserRole)
-            new_name = item.text().strip()
-
-            if entry and new_name and new_name != self._old_name:
-                # Emit rename signal
-                self.entry_renamed.emit(entry, new_name)
-            elif not new_name or new_name == "":
-                # Restore old name if empty
-                item.setText(self._old_name)
-
-            # Reset editing state
-            self._is_editing = False
-            self._editing_item = None
-            self._old_name = None
-
-    def editItem(self, item):
-        """Override to track when editing starts"""
-        if item.column() == 0:  # Only allow editing of name column
-            entry = item.data(Qt.ItemDataRole.UserRole)
-            if entry:
-                self._is_editing = True
-                self._editing_item = item
-                self._old_name = item.text()
-        super().editItem(item)
+        everything = QItemSelection(
+            self.proxy_model.index(0, 0),
+            self.proxy_model.index(rows - 1, self.proxy_model.columnCount() - 1),
+        )
+        self.selectionModel().select(
+            everything,
+            QItemSelectionModel.SelectionFlag.Toggle | QItemSelectionModel.SelectionFlag.Rows,
+        )
 
     def apply_filter(self, filter_text=None, filter_type=None, filter_rw_version=None):
         """Apply filter to table entries"""
-        for row in range(self.rowCount()):
-            show_row = True
-
-            name_item = self.item(row, 0)
-            type_item = self.item(row, 1)
-            rw_version_item = self.item(row, 4)  # RW Version column
-
-            # Get the entry object to check RenderWare properties
-            entry = name_item.data(Qt.ItemDataRole.UserRole) if name_item else None
-
-            if not entry:
-                continue
-
-            # Text filter
-            if filter_text and filter_text.lower() not in name_item.text().lower():
-                show_row = False
-
-            # File type filter - use entry.type property
-            if filter_type and filter_type != "All":
-                if entry.type != filter_type:
-                    show_row = False
-
-            # RenderWare version filter
-            if filter_rw_version and filter_rw_version != "All Versions":
-                if filter_rw_version == "RenderWare Only":
-                    if not entry.is_renderware_file():
-                        show_row = False
-                else:
-                    # For specific version names, check the entry's rw_version_name
-                    if entry.rw_version_name != filter_rw_version:
-                        show_row = False
-
-            self.setRowHidden(row, not show_row)
+        self.proxy_model.set_filter(filter_text, filter_type, filter_rw_version)
 
     def _get_selected_entries_for_drag(self):
         """Get selected entries for drag operation"""
-        selected_entries = []
-        for index in self.selectedIndexes():
-            if index.column() == 0:  # Only count each row once
-                entry = self.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
-                if entry:
-                    selected_entries.append(entry)
-        return selected_entries
+        return self.get_selected_entries()
 
     def keyPressEvent(self, event):
         """Handle key press events for shortcuts"""
@@ -689,7 +768,12 @@ class FilterPanel(QWidget):
 
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("🔍 Search entries...")
-        self.search_edit.textChanged.connect(self._filter_changed)
+        # Typing is debounced so a burst of keystrokes filters once
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._filter_changed)
+        self.search_edit.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(self.search_edit)
 
         # Apply responsive styling
@@ -790,17 +874,26 @@ class FilterPanel(QWidget):
 
     def update_filter_options(self, img_archive):
         """Update both file type and RW version options based on the archive content"""
-        if img_archive and hasattr(img_archive, 'entries'):
-            # Get unique file types and RW versions from the archive
-            file_types = img_archive.get_unique_file_types()
-            rw_versions = img_archive.get_unique_rw_versions()
-            
-            # Update the comboboxes
-            self.update_file_type_options(file_types)
-            self.update_rw_version_options(rw_versions)
-        else:
-            # Reset to default options if no archive
-            self.reset_filter_options()
+        # Refill the combos quietly, then filter once with the final selection
+        self.type_combo.blockSignals(True)
+        self.rw_version_combo.blockSignals(True)
+        try:
+            if img_archive and hasattr(img_archive, 'entries'):
+                # Get unique file types and RW versions from the archive
+                file_types = img_archive.get_unique_file_types()
+                rw_versions = img_archive.get_unique_rw_versions()
+
+                # Update the comboboxes
+                self.update_file_type_options(file_types)
+                self.update_rw_version_options(rw_versions)
+            else:
+                # Reset to default options if no archive
+                self.reset_filter_options()
+        finally:
+            self.type_combo.blockSignals(False)
+            self.rw_version_combo.blockSignals(False)
+
+        self._filter_changed()
 
     def reset_filter_options(self):
         """Reset filter options to default (empty archive state)"""
@@ -814,6 +907,8 @@ class FilterPanel(QWidget):
 
 __all__ = [
     "IMGFileInfoPanel",
+    "IMGEntriesModel",
+    "IMGEntriesFilterProxy",
     "IMGEntriesTable",
     "FilterPanel",
 ]
@@ -720,7 +720,7 @@ def _on_img_closed(self):
     self.file_info_panel.update_info(None)
     
     # Clear entries table
-    self.entries_table.setRowCount(0)
+    self.entries_table.clear_entries()
 
 def _on_entries_updated(self, entries):
     """Handle entries updated event"""
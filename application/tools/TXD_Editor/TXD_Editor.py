@@ -80,9 +80,6 @@ class TXDEditorTool(QWidget):
         
         main_layout.addWidget(self.tabs_widget)
 
-        # Apply styling
-        self.apply_styling()
-
     def create_toolbar(self):
         """Create the toolbar with basic actions"""
         self.toolbar = QFrame()
@@ -142,11 +139,6 @@ class TXDEditorTool(QWidget):
         dialog = TXDInfoDialog(txd_info, self.current_txd_tab.file_path, self)
         dialog.exec()
 
-    def apply_styling(self):
-        """Apply modern dark theme styling"""
-        theme = ModernDarkTheme()
-        self.setStyleSheet(theme.get_main_stylesheet())
-
     def open_txd_file(self):
         """Open a TXD file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -290,9 +282,6 @@ class TXDInfoDialog(QDialog):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
-        # Apply styling
-        self.setStyleSheet(ModernDarkTheme.get_main_stylesheet())
-
     def populate_info_text(self):
         """Populate the text area with TXD information"""
         info_text = f"""<h2>TXD File Information</h2>
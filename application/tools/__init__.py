@@ -1,12 +1,28 @@
 # Tools package for Renderware Modding Suite
 # Contains all individual tool implementations
 
+import importlib
+
 from application.tools.tool_registry import ToolRegistry
-from application.tools.IMG_Editor import ImgEditorTool
-from application.tools.DFF_Viewer.DFF_Viewer import DFFViewerTool
-from application.tools.RW_Analyze.RW_Analyze import RWAnalyzeTool
-from application.tools.IDE_Editor.IDE_Editor import IDEEditor
-from application.tools.TXD_Editor import TXDEditorTool
+
+# Tool classes are imported on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    'ImgEditorTool': 'application.tools.IMG_Editor',
+    'DFFViewerTool': 'application.tools.DFF_Viewer.DFF_Viewer',
+    'RWAnalyzeTool': 'application.tools.RW_Analyze.RW_Analyze',
+    'IDEEditor': 'application.tools.IDE_Editor.IDE_Editor',
+    'TXDEditorTool': 'application.tools.TXD_Editor',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'ToolRegistry', 
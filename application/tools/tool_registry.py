@@ -3,84 +3,116 @@ Tool Registry for Renderware Modding Suite
 Manages all available tools and their instantiation
 """
 
-from application.tools.IMG_Editor import ImgEditorTool
-from application.tools.DFF_Viewer.DFF_Viewer import DFFViewerTool
-from application.tools.RW_Analyze.RW_Analyze import RWAnalyzeTool
-from application.tools.IDE_Editor.IDE_Editor import IDEEditorTool
-from application.tools.TXD_Editor import TXDEditorTool
+import importlib
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
 
 
+@dataclass(frozen=True, slots=True)
+class ToolInfo:
+    """Registry entry describing one tool"""
+    name: str
+    class_path: str  # 'module:Class', imported on first use
+    description: str
+    icon: str
 
 
+def _intern_tools(tools):
+    """Intern tool names so lookups from UI handlers compare by identity first"""
+    return {sys.intern(tool_name): tool_info for tool_name, tool_info in tools.items()}
+
+
+# Writable backing store for ToolRegistry._tools
+_registered_tools = _intern_tools({
+    'IMG_Editor': ToolInfo(
+        name='IMG_Editor',
+        class_path='application.tools.IMG_Editor:ImgEditorTool',
+        description='Edit and manage IMG archive files',
+        icon='📁',
+    ),
+    'txd_editor': ToolInfo(
+        name='TXD Editor',
+        class_path='application.tools.TXD_Editor:TXDEditorTool',
+        description='Edit and view TXD texture dictionary files',
+        icon='🖼️',
+    ),
+    'dff_viewer': ToolInfo(
+        name='DFF Viewer',
+        class_path='application.tools.DFF_Viewer.DFF_Viewer:DFFViewerTool',
+        description='View and analyze 3D model files (DFF/OBJ)',
+        icon='📦',
+    ),
+    'rw_analyze': ToolInfo(
+        name='RW Analyze',
+        class_path='application.tools.RW_Analyze.RW_Analyze:RWAnalyzeTool',
+        description='Analyze RenderWare chunks (DFF/TXD/COL) with tree and details',
+        icon='🧩',
+    ),
+    'ide_editor': ToolInfo(
+        name='IDE Editor',
+        class_path='application.tools.IDE_Editor.IDE_Editor:IDEEditorTool',
+        description='Edit and validate IDE item definition files with table and raw views',
+        icon='📋',
+    ),
+    # Add other tools here as they are implemented
+})
+
 
 class ToolRegistry:
     """Registry for all available tools"""
-    
-    _tools = {
-        'IMG_Editor': {
-            'name': 'IMG_Editor',
-            'class': ImgEditorTool,
-            'description': 'Edit and manage IMG archive files',
-            'icon': '📁'
-        },
-        'txd_editor': {
-            'name': 'TXD Editor',
-            'class': TXDEditorTool,
-            'description': 'Edit and view TXD texture dictionary files',
-            'icon': '🖼️'
-        },
-        'dff_viewer': {
-            'name': 'DFF Viewer',
-            'class': DFFViewerTool,
-            'description': 'View and analyze 3D model files (DFF/OBJ)',
-            'icon': '📦'
-        },
-        'rw_analyze': {
-            'name': 'RW Analyze',
-            'class': RWAnalyzeTool,
-            'description': 'Analyze RenderWare chunks (DFF/TXD/COL) with tree and details',
-            'icon': '🧩'
-        },
-        'ide_editor': {
-            'name': 'IDE Editor',
-            'class': IDEEditorTool,
-            'description': 'Edit and validate IDE item definition files with table and raw views',
-            'icon': '📋'
-        },
-        # Add other tools here as they are implemented
-    }
+
+    # Read-only view of the registered tools; use register_tool() to add one
+    _tools = MappingProxyType(_registered_tools)
+
+    # Tool classes already imported, by tool name
+    _resolved = {}
 
     @classmethod
     def get_tool_info(cls, tool_name):
         """Get information about a tool"""
         return cls._tools.get(tool_name)
-    
+
     @classmethod
     def get_all_tools(cls):
         """Get all registered tools"""
         return cls._tools.copy()
-    
+
+    @classmethod
+    def get_tool_class(cls, tool_name):
+        """Import and return a tool's class, or None if the tool is unknown"""
+        tool_class = cls._resolved.get(tool_name)
+        if tool_class is None:
+            tool_info = cls._tools.get(tool_name)
+            if not tool_info or not tool_info.class_path:
+                return None
+            module_name, class_name = tool_info.class_path.split(':')
+            tool_class = getattr(importlib.import_module(module_name), class_name)
+            cls._resolved[tool_name] = tool_class
+        return tool_class
+
     @classmethod
     def create_tool(cls, tool_name, parent=None):
         """Create an instance of a tool"""
-        tool_info = cls._tools.get(tool_name)
-        if tool_info and tool_info['class']:
-            return tool_info['class'](parent)
+        tool_class = cls.get_tool_class(tool_name)
+        if tool_class:
+            return tool_class(parent)
         return None
-    
+
     @classmethod
     def is_tool_available(cls, tool_name):
         """Check if a tool is available and implemented"""
         tool_info = cls._tools.get(tool_name)
-        return tool_info is not None and tool_info['class'] is not None
-    
+        return tool_info is not None and bool(tool_info.class_path)
+
     @classmethod
     def register_tool(cls, tool_name, tool_class, name, description, icon):
         """Register a new tool"""
-        cls._tools[tool_name] = {
-            'name': name,
-            'class': tool_class,
-            'description': description,
-            'icon': icon
-        }
-        
\ No newline at end of file
+        tool_name = sys.intern(tool_name)
+        _registered_tools[tool_name] = ToolInfo(
+            name=name,
+            class_path=f"{tool_class.__module__}:{tool_class.__qualname__}",
+            description=description,
+            icon=icon,
+        )
+        cls._resolved[tool_name] = tool_class
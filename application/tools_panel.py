@@ -5,23 +5,65 @@ Contains various modding tools and operations
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QGroupBox, 
                             QPushButton, QComboBox, QMenu)
-from PyQt6.QtCore import pyqtSignal, QPoint
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QPoint, QEvent
 from .responsive_utils import get_responsive_manager
 
 
+# Tool buttons per group: (label, tooltip, tool name)
+_FILE_TOOLS = (
+    ("📦 IMG Editor", "Edit and manage IMG archive files", "IMG_Editor"),
+    ("🗃️ TXD Editor", "Edit texture dictionary files", "txd_editor"),
+    ("📦 DFF Viewer", "View and analyze 3D model files", "dff_viewer"),
+    ("📐 COL Editor", "Edit collision data files", "col_editor"),
+    ("🏃 IFP Editor", "Edit animation files", "ifp_editor"),
+)
+_MAP_TOOLS = (
+    ("📋 IDE Editor", "Edit item definition files", "ide_editor"),
+    ("📋 IPL Editor", "Edit item placement files", "ipl_editor"),
+    ("🌍 Zones/Cull Editor", "Edit zone and culling data", "zones_editor"),
+    ("🛣️ Traffic Path Utility", "Edit path network for vehicles and pedestrians", "traffic_path_editor"),
+    ("🌊 Water dat Editor", "Edit water effects and properties", "water_editor"),
+    ("🌤️ timecyc Editor", "Edit weather system and time cycles", "timecyc_editor"),
+)
+_DATA_TOOLS = (
+    ("🔫 Weapons Editor", "Edit weapon statistics and properties", "weapons_editor"),
+    ("🚗 Vehicles Editor", "Edit vehicle properties and data", "vehicles_editor"),
+    ("🚶 Pedestrians Editor", "Edit pedestrian data and behavior", "pedestrians_editor"),
+    ("🎛️ Handling Editor", "Edit vehicle handling properties", "handling_editor"),
+    ("📝 GXT Editor", "Edit text and font files", "gxt_editor"),
+)
+_UTIL_TOOLS = (
+    ("🔍 RW Analyze", "Analyze and debug Renderware files", "rw_analyze"),
+    ("✅ File Validator", "Validate file integrity and format", "file_validator"),
+)
+
+# Tools panel groups, top to bottom: (group title, tool buttons, button spacing).
+# Button spacing is a get_spacing_config() key, or None for the default layout spacing.
+_GROUPS = (
+    ("File Format Editors", _FILE_TOOLS, 'small'),
+    ("Map & World Tools", _MAP_TOOLS, None),
+    ("Data Editors", _DATA_TOOLS, None),
+    ("Utilities", _UTIL_TOOLS, None),
+)
+
+
 class ToolsPanel(QWidget):
     """Panel containing modding tools and operations"""
     
     toolRequested = pyqtSignal(str, dict)  # Signal when tool is requested (tool_name, params)
     
+    # Params sent with every panel button request; shared, so receivers must not modify it
+    _EMPTY_PARAMS = {}
+    
     def __init__(self):
         super().__init__()
+        # Group boxes whose buttons are built the first time they are shown
+        self._pending_groups = {}
         self.setup_ui()
     
     def setup_ui(self):
         """Setup the tools panel UI with responsive sizing"""
         rm = get_responsive_manager()
-        fonts = rm.get_font_config()
         spacing = rm.get_spacing_config()
         
         layout = QVBoxLayout()
@@ -30,169 +72,45 @@ class ToolsPanel(QWidget):
         # Header with responsive font
         header_label = QLabel("🔧 Renderware Modding Tools")
         header_label.setObjectName("titleLabel")
-        header_label.setStyleSheet(f"font-weight: bold; font-size: {fonts['header']['size']}px; padding: {spacing['small']}px;")
         layout.addWidget(header_label)
         
-        # File format editors
-        self.create_file_editors(layout)
-        
-        # Map & world tools
-        self.create_map_world_tools(layout)
-        
-        # Data editors
-        self.create_data_editors(layout)
-        
-        # Utilities
-        self.create_utilities(layout)
+        for title, items, button_spacing in _GROUPS:
+            self._build_group(title, items, button_spacing, layout)
         
         layout.addStretch()
         self.setLayout(layout)
     
-    def create_file_editors(self, layout):
-        """Create file format editors with responsive sizing"""
-        rm = get_responsive_manager()
-        spacing = rm.get_spacing_config()
-        
-        file_group = QGroupBox("File Format Editors")
-        file_layout = QVBoxLayout()
-        file_layout.setSpacing(spacing['small'])
-        
-        # IMG Editor
-        img_btn = QPushButton("📦 IMG Editor")
-        img_btn.setToolTip("Edit and manage IMG archive files")
-        img_btn.clicked.connect(lambda: self.toolRequested.emit("IMG_Editor", {}))
-        
-        # TXD Editor
-        txd_btn = QPushButton("🗃️ TXD Editor")
-        txd_btn.setToolTip("Edit texture dictionary files")
-        txd_btn.clicked.connect(lambda: self.toolRequested.emit("txd_editor", {}))
-        
-        # DFF Viewer
-        dff_btn = QPushButton("📦 DFF Viewer")
-        dff_btn.setToolTip("View and analyze 3D model files")
-        dff_btn.clicked.connect(lambda: self.toolRequested.emit("dff_viewer", {}))
-        
-        # COL Editor
-        col_btn = QPushButton("📐 COL Editor")
-        col_btn.setToolTip("Edit collision data files")
-        col_btn.clicked.connect(lambda: self.toolRequested.emit("col_editor", {}))
-        
-        # IFP Editor
-        ifp_btn = QPushButton("🏃 IFP Editor")
-        ifp_btn.setToolTip("Edit animation files")
-        ifp_btn.clicked.connect(lambda: self.toolRequested.emit("ifp_editor", {}))
-        
-        file_layout.addWidget(img_btn)
-        file_layout.addWidget(txd_btn)
-        file_layout.addWidget(dff_btn)
-        file_layout.addWidget(col_btn)
-        file_layout.addWidget(ifp_btn)
-        
-        file_group.setLayout(file_layout)
-        layout.addWidget(file_group)
+    @pyqtSlot()
+    def _on_tool_clicked(self):
+        """Request the tool named by the clicked button's tool_name property"""
+        self.toolRequested.emit(self.sender().property("tool_name"), self._EMPTY_PARAMS)
     
-    def create_map_world_tools(self, layout):
-        """Create map and world editing tools"""
-        map_group = QGroupBox("Map & World Tools")
-        map_layout = QVBoxLayout()
-        
-        # IDE Editor
-        ide_btn = QPushButton("📋 IDE Editor")
-        ide_btn.setToolTip("Edit item definition files")
-        ide_btn.clicked.connect(lambda: self.toolRequested.emit("ide_editor", {}))
-        
-        # IPL Editor
-        ipl_btn = QPushButton("📋 IPL Editor")
-        ipl_btn.setToolTip("Edit item placement files")
-        ipl_btn.clicked.connect(lambda: self.toolRequested.emit("ipl_editor", {}))
-        
-        # Zones/Cull Editor
-        zones_btn = QPushButton("🌍 Zones/Cull Editor")
-        zones_btn.setToolTip("Edit zone and culling data")
-        zones_btn.clicked.connect(lambda: self.toolRequested.emit("zones_editor", {}))
-        
-        # Traffic Path Utility
-        traffic_btn = QPushButton("🛣️ Traffic Path Utility")
-        traffic_btn.setToolTip("Edit path network for vehicles and pedestrians")
-        traffic_btn.clicked.connect(lambda: self.toolRequested.emit("traffic_path_editor", {}))
-        
-        # Water dat Editor
-        water_btn = QPushButton("🌊 Water dat Editor")
-        water_btn.setToolTip("Edit water effects and properties")
-        water_btn.clicked.connect(lambda: self.toolRequested.emit("water_editor", {}))
-        
-        # timecyc Editor
-        timecyc_btn = QPushButton("🌤️ timecyc Editor")
-        timecyc_btn.setToolTip("Edit weather system and time cycles")
-        timecyc_btn.clicked.connect(lambda: self.toolRequested.emit("timecyc_editor", {}))
-        
-        map_layout.addWidget(ide_btn)
-        map_layout.addWidget(ipl_btn)
-        map_layout.addWidget(zones_btn)
-        map_layout.addWidget(traffic_btn)
-        map_layout.addWidget(water_btn)
-        map_layout.addWidget(timecyc_btn)
-        
-        map_group.setLayout(map_layout)
-        layout.addWidget(map_group)
+    def _build_group(self, title, items, button_spacing, parent_layout):
+        """Add a group box whose (label, tooltip, tool name) buttons are built on first show"""
+        group = QGroupBox(title)
+        self._pending_groups[group] = (items, button_spacing)
+        group.installEventFilter(self)
+        parent_layout.addWidget(group)
     
-    def create_data_editors(self, layout):
-        """Create data and statistics editors"""
-        data_group = QGroupBox("Data Editors")
-        data_layout = QVBoxLayout()
-        
-        # Weapons Editor
-        weapons_btn = QPushButton("🔫 Weapons Editor")
-        weapons_btn.setToolTip("Edit weapon statistics and properties")
-        weapons_btn.clicked.connect(lambda: self.toolRequested.emit("weapons_editor", {}))
-        
-        # Vehicles Editor
-        vehicles_btn = QPushButton("🚗 Vehicles Editor")
-        vehicles_btn.setToolTip("Edit vehicle properties and data")
-        vehicles_btn.clicked.connect(lambda: self.toolRequested.emit("vehicles_editor", {}))
-        
-        # Pedestrians Editor
-        peds_btn = QPushButton("🚶 Pedestrians Editor")
-        peds_btn.setToolTip("Edit pedestrian data and behavior")
-        peds_btn.clicked.connect(lambda: self.toolRequested.emit("pedestrians_editor", {}))
-        
-        # Handling Editor
-        handling_btn = QPushButton("🎛️ Handling Editor")
-        handling_btn.setToolTip("Edit vehicle handling properties")
-        handling_btn.clicked.connect(lambda: self.toolRequested.emit("handling_editor", {}))
-        
-        # GXT Editor
-        gxt_btn = QPushButton("📝 GXT Editor")
-        gxt_btn.setToolTip("Edit text and font files")
-        gxt_btn.clicked.connect(lambda: self.toolRequested.emit("gxt_editor", {}))
-        
-        data_layout.addWidget(weapons_btn)
-        data_layout.addWidget(vehicles_btn)
-        data_layout.addWidget(peds_btn)
-        data_layout.addWidget(handling_btn)
-        data_layout.addWidget(gxt_btn)
-        
-        data_group.setLayout(data_layout)
-        layout.addWidget(data_group)
+    def eventFilter(self, obj, event):
+        """Populate a pending tool group when it is first shown"""
+        if event.type() == QEvent.Type.Show and obj in self._pending_groups:
+            obj.removeEventFilter(self)
+            self._populate_group(obj, *self._pending_groups.pop(obj))
+        return super().eventFilter(obj, event)
     
-    def create_utilities(self, layout):
-        """Create utility tools"""
-        util_group = QGroupBox("Utilities")
-        util_layout = QVBoxLayout()
-        
-        # RW Analyze
-        analyze_btn = QPushButton("🔍 RW Analyze")
-        analyze_btn.setToolTip("Analyze and debug Renderware files")
-        analyze_btn.clicked.connect(lambda: self.toolRequested.emit("rw_analyze", {}))
-        
-        # File Validator
-        validate_btn = QPushButton("✅ File Validator")
-        validate_btn.setToolTip("Validate file integrity and format")
-        validate_btn.clicked.connect(lambda: self.toolRequested.emit("file_validator", {}))
-        
-        
-        util_layout.addWidget(analyze_btn)
-        util_layout.addWidget(validate_btn)
-        
-        util_group.setLayout(util_layout)
-        layout.addWidget(util_group)
+    def _populate_group(self, group, items, button_spacing):
+        """Create the buttons of a tool group"""
+        # Buttons go into a detached layout that is attached once, with painting held off
+        group.setUpdatesEnabled(False)
+        group_layout = QVBoxLayout()
+        if button_spacing is not None:
+            group_layout.setSpacing(get_responsive_manager().get_spacing_config()[button_spacing])
+        for label, tooltip, tool_name in items:
+            button = QPushButton(label)
+            button.setToolTip(tooltip)
+            button.setProperty("tool_name", tool_name)
+            button.clicked.connect(self._on_tool_clicked)
+            group_layout.addWidget(button)
+        group.setLayout(group_layout)
+        group.setUpdatesEnabled(True)
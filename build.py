@@ -111,6 +111,14 @@ def build_executable_comprehensive():
     else:
         print(f"[WARNING] versionsets.json not found at: {versionsets_file}. Version mapping features may be degraded.")
 
+    # Ensure static resources (icons, welcome page, tool placeholder text) are bundled
+    # Keep relative path so application/common/resources.py finds RESOURCES_DIR
+    resources_dir = project_root / "application" / "resources"
+    if resources_dir.exists():
+        nuitka_cmd.insert(-1, f"--include-data-dir={resources_dir}=application/resources")
+    else:
+        print(f"[WARNING] resources directory not found at: {resources_dir}. Icons, the welcome page and tool placeholders will be missing in the build.")
+
     print("Running Nuitka command...")
     print(f"Command: {' '.join(nuitka_cmd)}")
     